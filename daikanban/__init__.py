@@ -3,7 +3,6 @@ from contextlib import contextmanager
 import logging
 import os
 from pathlib import Path
-import pdb  # noqa: T100
 import sys
 from typing import Optional
 
@@ -46,6 +45,7 @@ class Logger(logging.Logger):
             try:
                 yield
             except Exception as e:  # noqa: F841
+                import pdb  # noqa: T100
                 pdb.post_mortem()
         else:
             try:
@@ -1,8 +1,13 @@
+from collections.abc import Mapping
+from contextlib import suppress
 from datetime import datetime
-import itertools
+import heapq
 import json
+import os
 from pathlib import Path
-from typing import Any, Counter, Literal, Optional
+import stat
+import tempfile
+from typing import IO, Any, Callable, Counter, Iterable, Iterator, Literal, Optional, cast
 import uuid
 
 from pydantic import UUID4, Field, ValidationError
@@ -14,13 +19,75 @@ from daikanban import logger
 from daikanban.config import Config, get_config
 from daikanban.errors import AmbiguousProjectNameError, AmbiguousTaskNameError, BoardFileError, DuplicateProjectError, DuplicateTaskError, ProjectNotFoundError, TaskNotFoundError, UUIDImmutableError, VersionMismatchError, catch_key_error
 from daikanban.model import Id, Model, OptionalDatetime, Project, Task, TaskStatusAction, path_style
-from daikanban.utils import NameMatcher, count_fmt, exact_match, first_name_match, get_current_time
+from daikanban.utils import NameMatcher, case_insensitive_match, count_fmt, exact_match, first_name_match, fold_name, fuzzy_match, get_current_time, join_in_blocks, whitespace_insensitive_match
+
+
+# number of characters of JSON to buffer before each write when saving a board
+JSON_WRITE_BLOCK_SIZE = 1 << 16
+
+# name matchers under which matching names always have the same folded name (see fold_name)
+_FOLD_CONSISTENT_MATCHERS: tuple[NameMatcher, ...] = (exact_match, whitespace_insensitive_match, case_insensitive_match)
 
 
 #########
 # BOARD #
 #########
 
+def _name_index(items: dict[Id, Project] | dict[Id, Task], key: Optional[Callable[[str], str]] = None) -> dict[str, set[Id]]:
+    """Given a mapping from IDs to projects or tasks, gets a mapping from (exact) names to sets of IDs.
+    If a key function is given, the names are first transformed by it."""
+    index: dict[str, set[Id]] = {}
+    for (id_, item) in items.items():
+        index.setdefault(item.name if (key is None) else key(item.name), set()).add(id_)
+    return index
+
+def _unindex_name(index: dict[str, set[Id]], name: str, id_: Id) -> None:
+    """Removes an ID from a name index."""
+    ids = index[name]
+    ids.discard(id_)
+    if not ids:
+        del index[name]
+
+def _get_umask() -> int:
+    """Gets the process's file mode creation mask (which can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+class _IdAllocator:
+    """Finds the smallest integer ID not in use by a collection of items, without scanning all of them.
+    Keeps a heap of IDs which have been released (by deleting an item), along with a bound above which no IDs have been handed out."""
+
+    __slots__ = ('free_ids', 'next_id')
+
+    def __init__(self) -> None:
+        self.free_ids: list[Id] = []
+        self.next_id: Id = 0
+
+    def new_id(self, items: Mapping[Id, Any]) -> Id:
+        """Gets the smallest available ID, given the mapping of items currently in use."""
+        free_ids = self.free_ids
+        while free_ids and (free_ids[0] in items):  # discard released IDs which were later reused
+            heapq.heappop(free_ids)
+        if free_ids:
+            return free_ids[0]
+        id_ = self.next_id
+        while id_ in items:
+            id_ += 1
+        self.next_id = id_
+        return id_
+
+    def release(self, id_: Id) -> None:
+        """Marks an ID as no longer in use."""
+        if id_ < self.next_id:
+            heapq.heappush(self.free_ids, id_)
+
+    def reset(self) -> None:
+        """Marks all IDs as no longer in use."""
+        self.free_ids.clear()
+        self.next_id = 0
+
+
 @dataclass
 class Board(Model):
     """A DaiKanban board (collection of projects and tasks)."""
@@ -50,6 +117,16 @@ class Board(Model):
         # mappings from UUIDs to IDs
         self._project_uuid_to_id = {proj.uuid: id_ for (id_, proj) in self.projects.items()}
         self._task_uuid_to_id = {task.uuid: id_ for (id_, task) in self.tasks.items()}
+        # mappings from exact names to IDs (so exact name lookups avoid a linear scan)
+        self._project_name_to_ids = _name_index(self.projects)
+        # mapping from case-folded project names to IDs (so case-insensitive lookups avoid folding every name)
+        self._project_folded_name_to_ids = _name_index(self.projects, key=fold_name)
+        self._task_name_to_ids = _name_index(self.tasks)
+        # mapping from case-folded task names to IDs (so duplicate name checks avoid comparing against every task)
+        self._task_folded_name_to_ids = _name_index(self.tasks, key=fold_name)
+        # trackers of the smallest unused IDs
+        self._project_ids = _IdAllocator()
+        self._task_ids = _IdAllocator()
         self.check_valid_project_ids()
         self.check_valid_task_ids()
 
@@ -61,9 +138,11 @@ class Board(Model):
         """Checks that project IDs associated with all projects and tasks are in the set of known project IDs."""
         for project in self.projects.values():
             self._check_valid_project(project)
-        for task in self.tasks.values():
-            if (task.project_id is not None) and (task.project_id not in self.projects):
-                raise ProjectNotFoundError(task.project_id)
+        # many tasks share the same project, so check each distinct project ID once
+        project_ids = {task.project_id for task in self.tasks.values() if task.project_id is not None}
+        if (unknown_ids := project_ids - self.projects.keys()):
+            # report the first unknown ID in task order
+            raise ProjectNotFoundError(next(id_ for task in self.tasks.values() if (id_ := task.project_id) in unknown_ids))
         return self
 
     def _check_valid_task(self, task: Task) -> None:
@@ -98,22 +177,22 @@ class Board(Model):
         return f'{num_proj_str}, {num_task_str}'
 
     def new_project_id(self) -> Id:
-        """Gets an available integer as a project ID."""
-        return next(filter(lambda id_: id_ not in self.projects, itertools.count()))
+        """Gets an available integer as a project ID (the smallest one not in use)."""
+        return self._project_ids.new_id(self.projects)
 
     def new_project_uuid(self) -> UUID4:
         """Gets a unique UUID to be used for a new project."""
-        while (uuid_ := uuid.uuid4()) not in self._project_uuid_to_id:
+        while (uuid_ := uuid.uuid4()) in self._project_uuid_to_id:
             pass
         return uuid_
 
     def new_task_id(self) -> Id:
-        """Gets an available integer as a task ID."""
-        return next(filter(lambda id_: id_ not in self.tasks, itertools.count()))
+        """Gets an available integer as a task ID (the smallest one not in use)."""
+        return self._task_ids.new_id(self.tasks)
 
     def new_task_uuid(self) -> UUID4:
         """Gets a unique UUID to be used for a new task."""
-        while (uuid_ := uuid.uuid4()) not in self._task_uuid_to_id:
+        while (uuid_ := uuid.uuid4()) in self._task_uuid_to_id:
             pass
         return uuid_
 
@@ -122,19 +201,33 @@ class Board(Model):
         if project.uuid in self._project_uuid_to_id:
             raise DuplicateProjectError(f'Duplicate project UUID {str(project.uuid)!r}')
         self._check_valid_project(project)
-        matcher = get_config().name_matcher
-        project_names = (p.name for p in self.projects.values())
-        if (duplicate_name := first_name_match(matcher, project.name, project_names)) is not None:
+        if (duplicate_name := self._find_duplicate_project_name(project.name)) is not None:
             logger.warning(f'Duplicate project name {duplicate_name!r}')
         id_ = self.new_project_id()
         self.projects[id_] = project
         self._project_uuid_to_id[project.uuid] = id_
+        self._project_name_to_ids.setdefault(project.name, set()).add(id_)
+        self._project_folded_name_to_ids.setdefault(fold_name(project.name), set()).add(id_)
         return id_
 
-    @catch_key_error(ProjectNotFoundError)
+    def _find_duplicate_project_name(self, name: str, exclude_id: Optional[Id] = None) -> Optional[str]:
+        """Gets the name of a project (other than the one with the excluded ID) matching the given name under the configured name matcher, if there is one."""
+        matcher = get_config().name_matcher
+        if matcher in _FOLD_CONSISTENT_MATCHERS:
+            # only projects with the same folded name can match
+            ids: Iterable[Id] = sorted(self._project_folded_name_to_ids.get(fold_name(name), ()))
+        else:
+            ids = self.projects
+        project_names = (self.projects[id_].name for id_ in ids if (id_ != exclude_id))
+        return first_name_match(matcher, name, project_names)
+
     def get_project(self, project_id: Id) -> Project:
         """Gets a project with the given ID."""
-        return self.projects[project_id]
+        # a plain try/except (rather than catch_key_error) keeps this frequently called getter cheap
+        try:
+            return self.projects[project_id]
+        except KeyError:
+            raise ProjectNotFoundError(project_id) from None
 
     @staticmethod
     def _filter_id_matches(pairs: list[tuple[Id, bool]]) -> list[Id]:
@@ -144,7 +237,21 @@ class Board(Model):
 
     def get_project_id_by_name(self, name: str, matcher: NameMatcher = exact_match) -> Optional[Id]:
         """Gets the ID of the project with the given name, if it matches; otherwise, None."""
-        pairs = [(id_, name == p.name) for (id_, p) in self.projects.items() if matcher(name, p.name)]
+        if (exact_ids := self._project_name_to_ids.get(name)):  # exact matches take precedence
+            if len(exact_ids) > 1:
+                raise AmbiguousProjectNameError(f'Ambiguous project name {name!r}')
+            return next(iter(exact_ids))
+        if (matcher is case_insensitive_match) or (matcher is fuzzy_match):
+            # these matchers only compare case-folded names, so the folded name index can be used
+            folded = fold_name(name)
+            index = self._project_folded_name_to_ids
+            if (matcher is fuzzy_match) and (len(folded) >= 3):  # prefix match
+                match_ids: Iterable[Id] = (id_ for (key, ids) in index.items() if key.startswith(folded) for id_ in ids)
+            else:
+                match_ids = index.get(folded, ())
+            pairs = [(id_, name == self.projects[id_].name) for id_ in match_ids]
+        else:
+            pairs = [(id_, name == p.name) for (id_, p) in self.projects.items() if matcher(name, p.name)]
         ids = self._filter_id_matches(pairs)  # retain only exact matches, if present
         if ids:
             if len(ids) > 1:
@@ -157,25 +264,31 @@ class Board(Model):
         if 'uuid' in kwargs:
             raise UUIDImmutableError("Cannot modify a project's UUID")
         proj = self.get_project(project_id)
-        if 'name' in kwargs:
-            matcher = get_config().name_matcher
-            project_names = (p.name for (id_, p) in self.projects.items() if (id_ != project_id))
-            if (duplicate_name := first_name_match(matcher, kwargs['name'], project_names)) is not None:
-                logger.warning(f'Duplicate project name {duplicate_name!r}')
         kwargs = {'modified_time': get_current_time(), **kwargs}
-        proj = proj._replace(**kwargs)
-        self._check_valid_project(proj)
-        self.projects[project_id] = proj
+        new_proj = proj._replace(**kwargs)
+        self._check_valid_project(new_proj)
+        if ('name' in kwargs) and ((duplicate_name := self._find_duplicate_project_name(new_proj.name, exclude_id=project_id)) is not None):
+            logger.warning(f'Duplicate project name {duplicate_name!r}')
+        self.projects[project_id] = new_proj
+        if new_proj.name != proj.name:
+            _unindex_name(self._project_name_to_ids, proj.name, project_id)
+            self._project_name_to_ids.setdefault(new_proj.name, set()).add(project_id)
+            _unindex_name(self._project_folded_name_to_ids, fold_name(proj.name), project_id)
+            self._project_folded_name_to_ids.setdefault(fold_name(new_proj.name), set()).add(project_id)
 
     @catch_key_error(ProjectNotFoundError)
     def delete_project(self, project_id: Id) -> None:
         """Deletes a project with the given ID."""
-        del self._project_uuid_to_id[self.projects[project_id].uuid]
+        proj = self.projects[project_id]
+        del self._project_uuid_to_id[proj.uuid]
         del self.projects[project_id]
+        self._project_ids.release(project_id)
+        _unindex_name(self._project_name_to_ids, proj.name, project_id)
+        _unindex_name(self._project_folded_name_to_ids, fold_name(proj.name), project_id)
         # remove project ID from any tasks that have it
         for (task_id, task) in self.tasks.items():
             if task.project_id == project_id:
-                self.tasks[task_id] = task._replace(project_id=None)
+                self.tasks[task_id] = task._replace_unvalidated(project_id=None)
 
     def create_task(self, task: Task) -> Id:
         """Adds a new task and returns its ID."""
@@ -184,19 +297,46 @@ class Board(Model):
         self._check_valid_task(task)
         if task.project_id is not None:  # validate project ID
             _ = self.get_project(task.project_id)
-        matcher = get_config().name_matcher
-        incomplete_task_names = (t.name for t in self.tasks.values() if (t.completed_time is None))
-        if (duplicate_name := first_name_match(matcher, task.name, incomplete_task_names)) is not None:
+        if (duplicate_name := self._find_duplicate_task_name(task.name)) is not None:
             logger.warning(f'Duplicate task name {duplicate_name!r}')
         id_ = self.new_task_id()
         self.tasks[id_] = task
         self._task_uuid_to_id[task.uuid] = id_
+        self._task_name_to_ids.setdefault(task.name, set()).add(id_)
+        self._task_folded_name_to_ids.setdefault(fold_name(task.name), set()).add(id_)
         return id_
 
-    @catch_key_error(TaskNotFoundError)
+    def _find_duplicate_task_name(self, name: str, exclude_id: Optional[Id] = None) -> Optional[str]:
+        """Gets the name of an incomplete task (other than the one with the excluded ID) matching the given name under the configured name matcher, if there is one."""
+        matcher = get_config().name_matcher
+        if matcher in _FOLD_CONSISTENT_MATCHERS:
+            # only tasks with the same folded name can match
+            ids: Iterable[Id] = sorted(self._task_folded_name_to_ids.get(fold_name(name), ()))
+        else:
+            ids = self.tasks
+        incomplete_task_names = (t.name for id_ in ids if (id_ != exclude_id) and ((t := self.tasks[id_]).completed_time is None))
+        return first_name_match(matcher, name, incomplete_task_names)
+
     def get_task(self, task_id: Id) -> Task:
         """Gets a task with the given ID."""
-        return self.tasks[task_id]
+        # a plain try/except (rather than catch_key_error) keeps this frequently called getter cheap
+        try:
+            return self.tasks[task_id]
+        except KeyError:
+            raise TaskNotFoundError(task_id) from None
+
+    def _get_task_id_by_exact_name(self, name: str) -> Id:
+        """Gets the ID of the task whose name exactly matches the given one, using the name index.
+        The name must be present in the index."""
+        ids = self._task_name_to_ids[name]
+        incomplete_ids = [id_ for id_ in ids if (self.tasks[id_].completed_time is None)]
+        if incomplete_ids:
+            if len(incomplete_ids) > 1:
+                raise AmbiguousTaskNameError(f'Ambiguous task name {name!r}')
+            return incomplete_ids[0]
+        if len(ids) > 1:
+            raise AmbiguousTaskNameError(f'Multiple completed tasks match name {name!r}')
+        return next(iter(ids))
 
     def get_task_id_by_name(self, name: str, matcher: NameMatcher = exact_match) -> Optional[Id]:
         """Gets the ID of the task with the given name, if it matches; otherwise, None.
@@ -205,6 +345,8 @@ class Board(Model):
             - If there is an incomplete task, chooses this one
             - If there is a single complete task, chooses this one
             - Otherwise, raises AmbiguousTaskNameError"""
+        if name in self._task_name_to_ids:  # exact matches take precedence
+            return self._get_task_id_by_exact_name(name)
         incomplete_pairs: list[tuple[Id, bool]] = []
         complete_pairs: list[tuple[Id, bool]] = []
         for (id_, t) in self.tasks.items():
@@ -233,23 +375,30 @@ class Board(Model):
         """Updates a task with the given keyword arguments."""
         if 'uuid' in kwargs:
             raise ValueError("Cannot modify a task's UUID")
-        task = self.get_task(task_id)
-        incomplete_task_names = (t.name for (id_, t) in self.tasks.items() if (id_ != task_id) and (t.completed_time is None))
+        old_task = task = self.get_task(task_id)
         kwargs = {'modified_time': get_current_time(), **kwargs}
         task = task._replace(**kwargs)
         if task.project_id is not None:  # validate project ID
             _ = self.get_project(task.project_id)
         self._check_valid_task(task)
-        matcher = get_config().name_matcher
-        if (duplicate_name := first_name_match(matcher, task.name, incomplete_task_names)) is not None:
+        if (duplicate_name := self._find_duplicate_task_name(task.name, exclude_id=task_id)) is not None:
             logger.warning(f'Duplicate task name {duplicate_name!r}')
         self.tasks[task_id] = task
+        if task.name != old_task.name:
+            _unindex_name(self._task_name_to_ids, old_task.name, task_id)
+            self._task_name_to_ids.setdefault(task.name, set()).add(task_id)
+            _unindex_name(self._task_folded_name_to_ids, fold_name(old_task.name), task_id)
+            self._task_folded_name_to_ids.setdefault(fold_name(task.name), set()).add(task_id)
 
     @catch_key_error(TaskNotFoundError)
     def delete_task(self, task_id: Id) -> None:
         """Deletes a task with the given ID."""
-        del self._task_uuid_to_id[self.tasks[task_id].uuid]
+        task = self.tasks[task_id]
+        del self._task_uuid_to_id[task.uuid]
         del self.tasks[task_id]
+        self._task_ids.release(task_id)
+        _unindex_name(self._task_name_to_ids, task.name, task_id)
+        _unindex_name(self._task_folded_name_to_ids, fold_name(task.name), task_id)
 
     @catch_key_error(TaskNotFoundError)
     def reset_task(self, task_id: Id) -> None:
@@ -262,8 +411,8 @@ class Board(Model):
         """Changes a task to a new stage, based on the given action at the given time.
         Returns the new task."""
         task = self.get_task(task_id).apply_status_action(action, dt=dt, first_dt=first_dt)
-        incomplete_task_names = {t.name for (id_, t) in self.tasks.items() if (id_ != task_id) and (t.completed_time is None)}
-        if task.name in incomplete_task_names:
+        # only tasks with exactly the same name are considered duplicates here, so the exact name index suffices
+        if any((id_ != task_id) and (self.tasks[id_].completed_time is None) for id_ in self._task_name_to_ids.get(task.name, ())):
             logger.warning(f'Duplicate task name {task.name!r}')
         self.tasks[task_id] = task
         return task
@@ -273,9 +422,11 @@ class Board(Model):
         """Adds a task ID to the list of blocking tasks for another."""
         _ = self.get_task(blocking_task_id)  # ensure blocking task exists
         blocked_task = self.get_task(blocked_task_id)
-        blocked_by = set(blocked_task.blocked_by) if blocked_task.blocked_by else set()
-        blocked_by.add(blocking_task_id)
-        self.tasks[blocked_task_id] = blocked_task._replace(blocked_by=blocked_by)
+        if blocked_task.blocked_by and (blocking_task_id in blocked_task.blocked_by):
+            return
+        blocked_by = {*blocked_task.blocked_by, blocking_task_id} if blocked_task.blocked_by else {blocking_task_id}
+        # both task IDs are known to be valid, so there is no need to re-validate the task
+        self.tasks[blocked_task_id] = blocked_task._replace_unvalidated(blocked_by=blocked_by)
 
     @property
     def num_tasks_by_project(self) -> Counter[Id]:
@@ -330,16 +481,66 @@ class Board(Model):
         """Deletes all projects and tasks."""
         self.projects.clear()
         self.tasks.clear()
+        self._project_name_to_ids.clear()
+        self._project_folded_name_to_ids.clear()
+        self._task_name_to_ids.clear()
+        self._task_folded_name_to_ids.clear()
+        self._project_ids.reset()
+        self._task_ids.reset()
+
+    def _iter_json_bytes(self, **kwargs: Any) -> Iterator[bytes]:
+        """Renders the board as JSON, yielding UTF-8 encoded blocks of roughly JSON_WRITE_BLOCK_SIZE characters.
+        Keyword arguments are passed to the JSON encoder (as with `to_json_string`)."""
+        if (kwargs.get('indent') is not None) and (kwargs['indent'] < 0):
+            kwargs['indent'] = None
+        encoder = self.json_encoder()(**kwargs)
+        for block in join_in_blocks(encoder.iterencode(self.to_dict()), JSON_WRITE_BLOCK_SIZE):
+            yield block.encode()
+
+    def save(self, file: str | Path | IO[Any], **kwargs: Any) -> None:
+        """Saves the board as JSON to a path or file-like object.
+        When given a path, streams the JSON to the file in large encoded blocks, rather than materializing the whole document as one string or passing many small chunks through a text-mode file.
+        The bytes go to a temporary file in the same directory, which is synced to disk and then replaces the target, so an interrupted save never leaves a truncated board behind.
+        Symlinks are resolved first, so that the file they point to is replaced, and the permissions of an existing file are kept."""
+        if isinstance(file, (str, Path)):
+            path = Path(file).resolve()
+            try:
+                mode = stat.S_IMODE(path.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_get_umask()
+            (fd, tmp_name) = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+            tmp_path = Path(tmp_name)
+            try:
+                with open(fd, 'wb') as fp:
+                    for block in self._iter_json_bytes(**kwargs):
+                        fp.write(block)
+                    fp.flush()
+                    os.fsync(fp.fileno())
+                tmp_path.chmod(mode)
+                tmp_path.replace(path)
+            except BaseException:
+                with suppress(OSError):
+                    tmp_path.unlink()
+                raise
+        else:
+            super().save(file, **kwargs)
+
+    @classmethod
+    def load(cls, file: str | Path | IO[Any], **kwargs: Any) -> Self:
+        """Loads a board from a JSON path or file-like object.
+        Reads the raw contents in one call and lets pydantic parse and validate them directly, skipping the intermediate dict and the much slower field-by-field conversion of from_dict."""
+        data = Path(file).read_bytes() if isinstance(file, (str, Path)) else file.read()
+        return cast(Self, cls._type_adapter().validate_json(data, **kwargs))
 
 
 def load_board(name_or_path: str | Path, config: Optional[Config] = None) -> Board:
     """Given a board name or path, loads the board from a JSON file."""
     config = config or get_config()
     path = config.board.resolve_board_name_or_path(name_or_path)
-    if not path.exists():
-        raise BoardFileError(f'Board file {path_style(path)} does not exist')
     try:
         return Board.load(path)
+    except FileNotFoundError:
+        raise BoardFileError(f'Board file {path_style(path)} does not exist') from None
     except (json.JSONDecodeError, OSError, ValidationError) as e:
         e_str = escape(str(e)) if isinstance(e, ValidationError) else str(e)
         msg = f'When loading JSON {path_style(path)}: {e_str}'
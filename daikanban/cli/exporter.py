@@ -1,11 +1,14 @@
 from enum import Enum
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 from daikanban import logger
 from daikanban.cli import _load_board
-from daikanban.io import BaseExporter
+
+
+if TYPE_CHECKING:
+    from daikanban.io import BaseExporter
 
 
 class ExportFormat(str, Enum):
@@ -14,10 +17,10 @@ class ExportFormat(str, Enum):
     taskwarrior = 'taskwarrior'
 
     @property
-    def exporter(self) -> BaseExporter[Any]:
+    def exporter(self) -> 'BaseExporter[Any]':
         """Gets the BaseExporter class associated with this format."""
         mod = import_module(f'daikanban.ext.{self.name}')
-        return cast(BaseExporter[Any], mod.EXPORTER)
+        return cast('BaseExporter[Any]', mod.EXPORTER)
 
 
 def export_board(export_format: ExportFormat, board_file: Optional[Path] = None, output_file: Optional[Path] = None) -> None:
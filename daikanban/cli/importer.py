@@ -1,25 +1,28 @@
 from enum import Enum
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 from daikanban import logger
 from daikanban.cli import _load_board, _save_board
 from daikanban.config import get_config
-from daikanban.io import BaseImporter
 from daikanban.utils import count_fmt
 
 
+if TYPE_CHECKING:
+    from daikanban.io import BaseImporter
+
+
 class ImportFormat(str, Enum):
     """Enumeration of known BoardImporter import formats."""
     daikanban = 'daikanban'
     taskwarrior = 'taskwarrior'
 
     @property
-    def importer(self) -> BaseImporter[Any]:
+    def importer(self) -> 'BaseImporter[Any]':
         """Gets the BaseImporter class associated with this format."""
         mod = import_module(f'daikanban.ext.{self.name}')
-        return cast(BaseImporter[Any], mod.IMPORTER)
+        return cast('BaseImporter[Any]', mod.IMPORTER)
 
 
 def import_board(import_format: ImportFormat, board_name_or_path: Optional[str | Path] = None, input_file: Optional[Path] = None) -> None:
@@ -7,14 +7,12 @@ from rich import print
 import typer
 
 from daikanban import __version__, logger
-from daikanban.board import Board
 from daikanban.cli import APP_KWARGS
 import daikanban.cli.config
 from daikanban.cli.exporter import ExportFormat, export_board
 from daikanban.cli.importer import ImportFormat, import_board
 from daikanban.config import get_config
 from daikanban.errors import KanbanError
-from daikanban.interface import BoardInterface, list_boards
 
 
 #######
@@ -53,6 +51,8 @@ def import_(
 @APP.command(name='list', short_help='list all boards')
 def list_() -> None:
     """List all board files."""
+    # imported lazily, since it is slow to load
+    from daikanban.interface import list_boards
     cfg = get_config()
     default_board_path = cfg.board.default_board_path
     list_boards(cfg, active_board_path=default_board_path)
@@ -60,6 +60,8 @@ def list_() -> None:
 @APP.command(short_help='create new board')
 def new() -> None:
     """Create a new DaiKanban board."""
+    # imported lazily, since it is slow to load
+    from daikanban.interface import BoardInterface
     BoardInterface().new_board()
 
 @APP.command(short_help='display JSON schema')
@@ -67,6 +69,9 @@ def schema(
     indent: Annotated[int, typer.Option(help='JSON indentation level')] = 2
 ) -> None:
     """Print out the DaiKanban schema."""
+    # imported lazily, since it is slow to load
+    from daikanban.board import Board
+    from daikanban.interface import BoardInterface
     BoardInterface.show_schema(Board, indent=indent)
 
 @APP.command(short_help='enter interactive shell')
@@ -74,6 +79,8 @@ def shell(
     board: Annotated[Optional[Path], typer.Option('--board', '-b', help='DaiKanban board JSON file')] = None
 ) -> None:
     """Launch the DaiKanban shell."""
+    # imported lazily, since it is slow to load
+    from daikanban.interface import BoardInterface
     BoardInterface().launch_shell(board_path=board)
 
 @APP.callback(invoke_without_command=True)
@@ -1,21 +1,20 @@
 from dataclasses import field
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from operator import attrgetter
 from pathlib import Path
 import re
-from typing import Annotated, Any, Callable, Optional
+from typing import Annotated, Any, Callable, Optional, cast
 
 from fancy_dataclass import ConfigDataclass, TOMLDataclass
-import pendulum
 from pydantic import Field
 from pydantic.dataclasses import dataclass
-import pytimeparse  # type: ignore[import-untyped]
 from typing_extensions import Doc
 
 from daikanban import PROG
 from daikanban.errors import UserInputError
 from daikanban.task import TaskConfig, TaskStatus
-from daikanban.utils import HOURS_PER_DAY, SECS_PER_DAY, NameMatcher, case_insensitive_match, convert_number_words_to_digits, get_current_time, replace_relative_time_expression, whitespace_insensitive_match
+from daikanban.utils import DAYS_PER_WEEK, HOURS_PER_DAY, SECS_PER_DAY, SECS_PER_HOUR, NameMatcher, case_insensitive_match, convert_number_words_to_digits, get_current_time, replace_relative_time_expression, whitespace_insensitive_match
 
 
 ############
@@ -117,6 +116,68 @@ class BoardConfig(TOMLDataclass):
         return sorted([p for p in self.board_dir_path.glob('*') if str(p).lower().endswith('.json')])
 
 
+# a single quantity with a unit (the most common form of duration), along with the number of seconds per unit
+_SIMPLE_DURATION = re.compile(r'(\d+(?:\.\d+)?)\s*(w|weeks?|d|days?|h|hrs?|hours?|m|mins?|minutes?|s|secs?|seconds?)', re.ASCII | re.IGNORECASE)
+_SECS_PER_UNIT = {'w': DAYS_PER_WEEK * SECS_PER_DAY, 'd': SECS_PER_DAY, 'h': SECS_PER_HOUR, 'm': 60, 's': 1}
+
+def _parse_seconds(s: str) -> Optional[float]:
+    """Parses a duration string into a number of seconds (or None if it is invalid).
+    Simple durations like "3 days" are handled directly, with the same result as pytimeparse; anything else is passed to pytimeparse."""
+    if (match := _SIMPLE_DURATION.fullmatch(s)):
+        (num, unit) = match.groups()
+        secs_per_unit = _SECS_PER_UNIT[unit[0].lower()]
+        if num.isdigit():
+            return int(num) * secs_per_unit
+        # like pytimeparse, truncate to whole seconds unless the unit is seconds
+        return float(num) if (secs_per_unit == 1) else int(float(num) * secs_per_unit)
+    import pytimeparse  # type: ignore[import-untyped]  # imported lazily, since it is slow to load
+    return cast(Optional[float], pytimeparse.parse(s))
+
+
+# units which are converted to days before parsing a duration
+_FLOAT_EXPR = r'(\d+(\.\d+)?)'
+_YEARS_EXPR = re.compile(_FLOAT_EXPR + r'\s+years?')
+_MONTHS_EXPR = re.compile(_FLOAT_EXPR + r'\s+months?')
+_WORK_WEEKS_EXPR = re.compile(_FLOAT_EXPR + r'\s+work[-\s]*weeks?')
+_WORK_DAYS_EXPR = re.compile(_FLOAT_EXPR + r'\s+work[-\s]*days?')
+
+def _replace_work_durations(s: str, hours_per_work_day: float, days_per_work_week: float) -> str:
+    """Replaces units of "years", "months", "workweeks", or "workdays" with days."""
+    def from_years(years: float) -> float:
+        return 365 * years
+    def from_months(months: float) -> float:
+        return 30 * months
+    def from_work_days(work_days: float) -> float:
+        return hours_per_work_day * work_days / HOURS_PER_DAY
+    def from_work_weeks(work_weeks: float) -> float:
+        return from_work_days(days_per_work_week * work_weeks)
+    def _repl(func: Callable[[float], float]) -> Callable[[re.Match[str]], str]:
+        def _get_day_str(match: re.Match[str]) -> str:
+            val = float(match.groups(0)[0])
+            return f'{func(val)} days'
+        return _get_day_str
+    for (pat, func) in [(_YEARS_EXPR, from_years), (_MONTHS_EXPR, from_months), (_WORK_WEEKS_EXPR, from_work_weeks), (_WORK_DAYS_EXPR, from_work_days)]:
+        s = pat.sub(_repl(func), s)
+    return s
+
+@lru_cache(maxsize=256)
+def _parse_duration(s: str, hours_per_work_day: float, days_per_work_week: float) -> float:
+    """Parses a duration string into a number of days, given the work time settings.
+    Since this is a pure function of its arguments, it is memoized (invalid input raises an error, which is not cached)."""
+    s = s.strip()
+    if not s:
+        raise UserInputError('Empty duration string') from None
+    s = _replace_work_durations(convert_number_words_to_digits(s), hours_per_work_day, days_per_work_week)
+    try:
+        secs = _parse_seconds(s)
+        assert secs is not None
+    except (AssertionError, ValueError):
+        raise UserInputError('Invalid time duration') from None
+    if secs < 0:
+        raise UserInputError('Time duration cannot be negative')
+    return float(secs) / SECS_PER_DAY
+
+
 @dataclass
 class TimeConfig(TOMLDataclass):
     """Time configurations."""
@@ -153,62 +214,40 @@ class TimeConfig(TOMLDataclass):
             return self.parse_datetime(replaced)
         try:  # prefer the standard datetime format
             return datetime.strptime(s, self.datetime_format)
-        except ValueError:  # attempt to parse string more flexibly
-            # pendulum doesn't allow single-digit hours for some reason, so pad it with a zero
-            tokens = s.split()
-            if (len(tokens) >= 2) and (tok := tokens[-1]).isdigit() and (len(tok) == 1):
-                s = ' '.join(tokens[:-1] + ['0' + tok])
-            try:
-                dt: datetime = pendulum.parse(s, strict=False, tz=pendulum.local_timezone())  # type: ignore
-                assert isinstance(dt, datetime)
+        except ValueError:
+            pass
+        import pendulum.parsing  # imported lazily, since it is slow to load
+        try:  # ISO 8601 strings can be parsed without pendulum's (slower) parser
+            dt = datetime.fromisoformat(s)
+        except ValueError:
+            pass
+        else:
+            if dt.tzinfo:
                 return dt
-            except (AssertionError, pendulum.parsing.exceptions.ParserError):
-                # TODO: handle work day/week?
-                # (difficult since calculating relative times requires knowing which hours/days are work times
-                raise err from None
+            # like pendulum.parse, interpret a naive time in the local timezone with fold=1
+            # (so a time skipped by a DST change moves forward, and a repeated time resolves to its later occurrence)
+            return pendulum.instance(dt.replace(fold=1), tz=pendulum.local_timezone())  # type: ignore[operator]
+        # attempt to parse string more flexibly
+        # pendulum doesn't allow single-digit hours for some reason, so pad it with a zero
+        tokens = s.split()
+        if (len(tokens) >= 2) and (tok := tokens[-1]).isdigit() and (len(tok) == 1):
+            s = ' '.join(tokens[:-1] + ['0' + tok])
+        try:
+            dt = pendulum.parse(s, strict=False, tz=pendulum.local_timezone())  # type: ignore
+            assert isinstance(dt, datetime)
+            return dt
+        except (AssertionError, pendulum.parsing.exceptions.ParserError):
+            # TODO: handle work day/week?
+            # (difficult since calculating relative times requires knowing which hours/days are work times
+            raise err from None
 
     def render_datetime(self, dt: datetime) -> str:
         """Renders a datetime object as a string."""
         return dt.strftime(self.datetime_format)
 
-    def _replace_work_durations(self, s: str) -> str:
-        """Replaces units of "years", "months", "workweeks", or "workdays" with days."""
-        float_regex = r'(\d+(\.\d+)?)'
-        pat_years = float_regex + r'\s+years?'
-        def from_years(years: float) -> float:
-            return 365 * years
-        pat_months = float_regex + r'\s+months?'
-        def from_months(months: float) -> float:
-            return 30 * months
-        pat_work_days = float_regex + r'\s+work[-\s]*days?'
-        def from_work_days(work_days: float) -> float:
-            return self.hours_per_work_day * work_days / HOURS_PER_DAY
-        pat_work_weeks = float_regex + r'\s+work[-\s]*weeks?'
-        def from_work_weeks(work_weeks: float) -> float:
-            return from_work_days(self.days_per_work_week * work_weeks)
-        def _repl(func: Callable[[float], float]) -> Callable[[re.Match[str]], str]:
-            def _get_day_str(match: re.Match[str]) -> str:
-                val = float(match.groups(0)[0])
-                return f'{func(val)} days'
-            return _get_day_str
-        for (pat, func) in [(pat_years, from_years), (pat_months, from_months), (pat_work_weeks, from_work_weeks), (pat_work_days, from_work_days)]:
-            s = re.sub(pat, _repl(func), s)
-        return s
-
     def parse_duration(self, s: str) -> float:
         """Parses a duration from a string."""
-        s = s.strip()
-        if not s:
-            raise UserInputError('Empty duration string') from None
-        s = self._replace_work_durations(convert_number_words_to_digits(s))
-        try:
-            secs = pytimeparse.parse(s)
-            assert secs is not None
-        except (AssertionError, ValueError):
-            raise UserInputError('Invalid time duration') from None
-        if secs < 0:
-            raise UserInputError('Time duration cannot be negative')
-        return float(secs) / SECS_PER_DAY
+        return _parse_duration(s, self.hours_per_work_day, self.days_per_work_week)
 
 
 @dataclass
@@ -295,11 +334,14 @@ class Config(ConfigDataclass, TOMLDataclass, doc_as_comment=True):  # type: igno
         The representation will depend on its type and the configs."""
         if val is None:
             return '-'
+        if type(val) is str:  # most common case (e.g. pre-rendered table cells)
+            return val
         if isinstance(val, float):
-            return str(int(val)) if (int(val) == val) else f'{val:.3g}'
+            return str(int(val)) if val.is_integer() else f'{val:.3g}'
         if isinstance(val, datetime):  # human-readable date
             if get_current_time() - val >= timedelta(days=7):
                 return val.strftime(self.time.date_format)
+            import pendulum  # imported lazily, since it is slow to load
             return pendulum.instance(val).diff_for_humans()
         if isinstance(val, date):
             tzinfo = get_current_time().tzinfo
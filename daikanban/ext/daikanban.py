@@ -32,6 +32,14 @@ class DaiKanbanImporter(JSONImporter[BoardDict]):
         """Converts a BoardDict to a Board."""
         return Board.from_dict(obj)
 
+    def read_board(self, fp: IO[Any], **kwargs: Any) -> Board:
+        """Loads a Board from a file-like object.
+        Since the file is already in the board's own format, this parses it directly rather than going through a BoardDict.
+        Any keyword arguments are passed to json.load (e.g. parse_float, object_hook), in which case the file is read via a BoardDict instead."""
+        if kwargs:
+            return super().read_board(fp, **kwargs)
+        return Board.load(fp)
+
 
 class DaiKanbanExporter(JSONExporter[BoardDict]):
     """Handles exporting a DaiKanban board to a JSON file."""
@@ -1,22 +1,20 @@
 from collections import defaultdict
+from contextlib import suppress
 from dataclasses import Field, dataclass, field, fields, make_dataclass
 from datetime import datetime, timedelta
-from functools import cache, wraps
+from functools import cache, lru_cache, wraps
+from inspect import ismethod
 import json
 from numbers import Real
 from pathlib import Path
-import readline  # improves shell interactivity  # noqa: F401
 import shlex
 import sys
-from typing import TYPE_CHECKING, Annotated, Any, Callable, Generic, Iterable, Optional, Type, TypeVar, cast
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Generic, Iterable, Iterator, Optional, Type, TypeVar, cast
 
-import pendulum
-import pendulum.parsing
 from pydantic import ValidationError
 from rich import print
 from rich.console import Console
 from rich.prompt import Confirm
-from rich.table import Table
 from typing_extensions import Concatenate, Doc, ParamSpec
 
 from daikanban import PKG_DIR, logger
@@ -24,13 +22,14 @@ from daikanban.board import Board, load_board
 from daikanban.config import Config, get_config
 from daikanban.errors import BoardFileError, BoardNotLoadedError, InvalidTaskStatusError, KanbanError, TaskStatusError, UserInputError
 from daikanban.model import DefaultColor, Id, Model, Project, Task, TaskStatusAction, cmd_style, name_style, path_style, proj_id_style, status_style, task_id_style
-from daikanban.prompt import FieldPrompter, Prompter, model_from_prompt, simple_input
+from daikanban.prompt import NONBLANK_INPUT, NONEMPTY_INPUT, FieldPrompter, Prompter, model_from_prompt, simple_input
 from daikanban.task import TaskStatus
-from daikanban.utils import NotGiven, NotGivenType, err_style, fuzzy_match, get_current_time, get_duration_between, human_readable_duration, parse_key_value_pair, parse_string_set, prefix_match, style_str, to_snake_case
+from daikanban.utils import NotGiven, NotGivenType, duration_in_words, err_style, frozen_current_time, fuzzy_match, get_current_time, get_duration_between, human_readable_duration, make_prefix_map, parse_key_value_pair, parse_string_set, style_str, to_snake_case
 
 
 if TYPE_CHECKING:
     from _typeshed import DataclassInstance
+    from rich.table import Table
 
 
 M = TypeVar('M')
@@ -39,6 +38,8 @@ BI = TypeVar('BI', bound='BoardInterface')
 P = ParamSpec('P')
 
 BILLBOARD_ART_PATH = PKG_DIR / 'billboard_art.txt'
+# characters handled differently by shlex than by str.split (quotes, escapes, and whitespace shlex does not split on)
+_SHELL_SPECIAL_CHARS = frozenset('\'"\\\x0b\x0c\x1c\x1d\x1e\x1f')
 
 
 ####################
@@ -48,8 +49,20 @@ BILLBOARD_ART_PATH = PKG_DIR / 'billboard_art.txt'
 @cache
 def get_billboard_art() -> str:
     """Loads billboard ASCII art from a file."""
-    with open(BILLBOARD_ART_PATH) as f:
-        return f.read()
+    return BILLBOARD_ART_PATH.read_text(encoding='utf-8')
+
+@lru_cache(maxsize=8)
+def get_schema_string(cls: type[Model], indent: int = 2) -> str:
+    """Gets the JSON schema of the given type, rendered as a string.
+    Generating the schema walks the entire model graph, so the result is cached."""
+    return json.dumps(cls.json_schema(mode='serialization'), indent=indent)
+
+def split_prompt(prompt: str) -> list[str]:
+    """Splits a user prompt into tokens, following shell syntax.
+    Most prompts contain no quotes or escapes, in which case a plain whitespace split gives the same result as shlex."""
+    if _SHELL_SPECIAL_CHARS.isdisjoint(prompt) and prompt.isascii():
+        return prompt.split()
+    return shlex.split(prompt)
 
 def split_comma_list(s: str) -> list[str]:
     """Given a comma-separated list, splits it into a list of strings."""
@@ -100,33 +113,72 @@ def validate_task_name(name: str) -> str:
     return _validate_project_or_task_name(name, 'task')
 
 
+###########
+# PROMPTS #
+###########
+
+# prompts for each field when creating a new project
+NEW_PROJECT_PROMPTS = {
+    'name': 'Project name',
+    'description': 'Description',
+    'links': 'Links [not bold]\\[optional, comma-separated][/]',
+}
+
+# prompts for each field when creating a new task
+NEW_TASK_PROMPTS = {
+    'name': 'Task name',
+    'description': 'Description',
+    'project_id': 'Project ID or name [not bold]\\[optional][/]',
+    'priority': 'Priority [not bold]\\[optional, 0-10][/]',
+    'expected_difficulty': 'Expected difficulty [not bold]\\[optional, 0-10][/]',
+    'expected_duration': 'Expected duration [not bold]\\[optional, e.g. "3 days", "2 months"][/]',
+    'due': 'Due date [not bold]\\[optional][/]',
+    'tags': 'Tags [not bold]\\[optional, comma-separated][/]',
+    'links': 'Links [not bold]\\[optional, comma-separated][/]',
+}
+
+_cached_field_prompter = cache(FieldPrompter)
+
+def get_field_prompter(model_type: type[M], field: str, prompt: str, parse: Optional[Callable[[str], Any]] = None) -> FieldPrompter[M, Any]:
+    """Gets a FieldPrompter for the given model field, prompt string, and parser.
+    Since FieldPrompters are stateless, one is built only once per combination of arguments, unless the parser is a method bound to some object."""
+    factory: Callable[..., FieldPrompter[M, Any]] = FieldPrompter if ismethod(parse) else _cached_field_prompter
+    return factory(model_type, field, prompt=prompt, parse=parse)
+
+
 ###################
 # PRETTY PRINTING #
 ###################
 
-def make_table(tp: type['DataclassInstance'], rows: Iterable[M], suppress_cols: Optional[list[str]] = None, **kwargs: Any) -> Table:
+@cache
+def _table_columns(tp: type['DataclassInstance']) -> tuple[tuple[str, str, dict[str, Any]], ...]:
+    """Given a model type, gets a tuple of (field name, column title, column kwargs) for each field, caching the result."""
+    columns = []
+    for fld in fields(tp):
+        metadata = fld.metadata or {}  # type: ignore[var-annotated]
+        title = metadata.get('title', fld.name)
+        kw = {key: val for (key, val) in metadata.items() if (key != 'title')}
+        columns.append((fld.name, title, kw))
+    return tuple(columns)
+
+def make_table(tp: type['DataclassInstance'], rows: Iterable[M], suppress_cols: Optional[list[str]] = None, **kwargs: Any) -> 'Table':
     """Given a model type and a list of objects of that type, creates a Table displaying the data, with each object being a row.
     If a suppress_cols list is given, suppresses these columns from the table."""
+    from rich.table import Table  # imported lazily, since it is slow to load
     table = Table(**kwargs)
-    flags = []  # indicates whether each field has any nontrivial element
-    field_names = []
+    field_names = []  # fields to display
     suppress = set(suppress_cols) if suppress_cols else set()
-    for fld in fields(tp):
-        field_names.append(fld.name)
-        flag = (fld.name not in suppress) and any(getattr(row, fld.name) is not None for row in rows)
-        flags.append(flag)
-        if flag:  # skip column if all values are trivial
-            metadata = fld.metadata or {}  # type: ignore[var-annotated]
-            title = metadata.get('title', fld.name)
-            kw = {key: val for (key, val) in metadata.items() if (key != 'title')}
+    for (name, title, kw) in _table_columns(tp):
+        # skip column if all values are trivial
+        if (name not in suppress) and any(getattr(row, name) is not None for row in rows):
+            field_names.append(name)
             table.add_column(title, **kw)
-    config = get_config()
+    pretty_value = get_config().pretty_value
     for row in rows:
-        vals = [config.pretty_value(getattr(row, name)) for (flag, name) in zip(flags, field_names) if flag]
-        table.add_row(*vals)
+        table.add_row(*[pretty_value(getattr(row, name)) for name in field_names])
     return table
 
-@dataclass
+@dataclass(slots=True)
 class ProjectRow:
     """A display table row associated with a project.
     These rows are presented in the project list view."""
@@ -135,7 +187,7 @@ class ProjectRow:
     created: str
     num_tasks: int = field(metadata={'title': '# tasks', 'justify': 'right'})
 
-@dataclass
+@dataclass(slots=True)
 class TaskRow:
     """A display table row associated with a task.
     These rows are presented in the task list view."""
@@ -201,6 +253,42 @@ class TaskColSettings(Generic[M]):
             task_rows.sort(key=key, reverse=(not asc))
 
 
+############
+# COMMANDS #
+############
+
+# maps from (sufficiently long) command prefixes to the corresponding full commands
+# NOTE: where a prefix is ambiguous, the command listed first takes precedence
+MAIN_COMMANDS = make_prefix_map(['board', 'help', ('info', 4), 'project', 'quit', ('exit', 4), 'task'])
+BOARD_COMMANDS = make_prefix_map(['help', 'delete', ('list', 2), ('load', 2), 'new', 'show', ('schema', 2)])
+PROJECT_COMMANDS = make_prefix_map(['help', 'new', 'delete', 'show', ('set', 3)])
+# for convenience, use 'begin' instead of 'start' to avoid prefix collision with 'show'
+TASK_COMMANDS = make_prefix_map(['help', 'new', 'delete', 'show', ('set', 3), 'begin', 'complete', 'pause', 'resume', 'todo'])
+# options for 'board show' (singular forms are prefixes of the plural ones)
+BOARD_SHOW_OPTIONS = make_prefix_map([('statuses', 3), ('projects', 3), ('tags', 3), ('limit', 3), ('since', 5)])
+
+# map from task subcommands to status actions
+TASK_STATUS_ACTIONS = {
+    'begin': TaskStatusAction.start,
+    'complete': TaskStatusAction.complete,
+    'pause': TaskStatusAction.pause,
+    'resume': TaskStatusAction.resume,
+}
+
+# map from command groups to their (prefixed) subcommands
+SUBCOMMANDS = {'board': BOARD_COMMANDS, 'project': PROJECT_COMMANDS, 'task': TASK_COMMANDS}
+
+# map from (status, action) to the intermediate action implied by the transition, which occurs if:
+#   todo -> active -> complete
+#   todo -> active -> paused
+#   paused -> active -> complete
+INTERMEDIATE_STATUS_ACTIONS = {
+    (TaskStatus.todo, TaskStatusAction.complete): TaskStatusAction.start,
+    (TaskStatus.todo, TaskStatusAction.pause): TaskStatusAction.start,
+    (TaskStatus.paused, TaskStatusAction.complete): TaskStatusAction.resume,
+}
+
+
 ###################
 # BOARD INTERFACE #
 ###################
@@ -234,13 +322,17 @@ def list_boards(config: Optional[Config] = None, active_board_path: Optional[Pat
         print(f'  {prefix}{p.name}')
 
 
-@dataclass
+@dataclass(slots=True)
 class BoardInterface:
     """Interactive user interface to view and manipulate a DaiKanban board.
     This object maintains a state containing the currently loaded board and configurations."""
     board_path: Annotated[Optional[Path], Doc('path of current board')] = None
     board: Annotated[Optional[Board], Doc('current DaiKanban board')] = None
     config: Annotated[Config, Doc('global configurations')] = field(default_factory=get_config)
+    # cache of help menu tables, keyed by subgroup
+    _help_tables: dict[Optional[str], 'Table'] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # cache of FieldPrompters for creating new items, keyed by model type and field
+    _new_item_prompters: dict[tuple[type, str], FieldPrompter[Any, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def _parse_id(self, item_type: str, s: str) -> Optional[Id]:
         s = s.strip()
@@ -266,6 +358,17 @@ class BoardInterface:
             return cast(Id, id_)
         raise UserInputError(f'Invalid {item_type} name {name_style(s)}')
 
+    def _get_new_item_prompters(self, model_type: type[M], prompts: dict[str, str], get_parsers: Callable[..., dict[str, Callable[[str], Any]]]) -> dict[str, FieldPrompter[M, Any]]:
+        """Given a dict from fields to prompt strings, gets a dict from fields to FieldPrompters for creating a new project or task.
+        These are built on first use and then reused, since the parsers only consult the interface's state when called."""
+        cache = self._new_item_prompters
+        if any((model_type, fld) not in cache for fld in prompts):
+            parsers = get_parsers(is_update=False)
+            for (fld, prompt) in prompts.items():
+                if (model_type, fld) not in cache:
+                    cache[model_type, fld] = get_field_prompter(model_type, fld, prompt, parsers.get(fld))
+        return {fld: cache[model_type, fld] for fld in prompts}
+
     def _parse_project_id(self, id_str: str) -> Optional[Id]:
         return self._parse_id('project', id_str)
 
@@ -286,14 +389,15 @@ class BoardInterface:
 
     def _prompt_and_parse_task(self, id_or_name: Optional[str]) -> Id:
         if id_or_name is None:
-            id_or_name = simple_input('Task ID or name', match='.+')
+            id_or_name = simple_input('Task ID or name', match=NONEMPTY_INPUT)
         id_ = self._parse_task(id_or_name)
         assert id_ is not None
         return id_
 
-    def _model_pretty(self, obj: Model, id_: Optional[Id] = None) -> Table:
+    def _model_pretty(self, obj: Model, id_: Optional[Id] = None) -> 'Table':
         """Given a Model object (and optional ID), creates a two-column Table displaying its contents prettily."""
         assert self.board is not None
+        from rich.table import Table  # imported lazily, since it is slow to load
         table = Table(show_header=False)
         table.add_column('Field', style='bold')
         table.add_column('Value')
@@ -320,15 +424,16 @@ class BoardInterface:
 
     # HELP/INFO
 
-    def make_new_help_table(self) -> Table:
+    def make_new_help_table(self) -> 'Table':
         """Creates a new 3-column rich table for displaying help menus."""
+        from rich.table import Table  # imported lazily, since it is slow to load
         grid = Table.grid(padding=(0, 2))
         grid.add_column(style='bold')
         grid.add_column(style='bold')
         grid.add_column()
         return grid
 
-    def add_board_help(self, grid: Table) -> None:
+    def add_board_help(self, grid: 'Table') -> None:
         """Adds entries to help menu related to boards."""
         statuses = ', '.join(TaskStatus)
         grid.add_row('\\[b]oard', 'list', 'list all boards')
@@ -343,7 +448,7 @@ class BoardInterface:
         grid.add_row('', '', '  limit=\\[SIZE]       | max number of tasks to show per column (a number, or "none" for no limit)')
         grid.add_row('', '', '  since=\\[WHEN]       | date/time expression (or "anytime" for no time limit), used to limit completed tasks only')
 
-    def add_project_help(self, grid: Table) -> None:
+    def add_project_help(self, grid: 'Table') -> None:
         """Adds entries to help menu related to projects."""
         id_str = '[not bold]\\[ID/NAME][/]'
         grid.add_row('\\[p]roject', f'\\[d]elete {id_str}', 'delete a project')
@@ -352,7 +457,7 @@ class BoardInterface:
         grid.add_row('', f'\\[s]how {id_str}', 'show project info')
         grid.add_row('', f'set {id_str} [not bold]\\[FIELD] \\[VALUE][/]', 'change a project attribute')
 
-    def add_task_help(self, grid: Table) -> None:
+    def add_task_help(self, grid: 'Table') -> None:
         """Adds entries to help menu related to tasks."""
         id_str = '[not bold]\\[ID/NAME][/]'
         grid.add_row('\\[t]ask', f'\\[d]elete {id_str}', 'delete a task')
@@ -366,26 +471,32 @@ class BoardInterface:
         grid.add_row('', f'\\[r]esume {id_str}', 'resume a paused or completed task')
         grid.add_row('', f'\\[t]odo {id_str}', "reset a task to the 'todo' state")
 
+    def _get_help_table(self, subgroup: Optional[str] = None) -> 'Table':
+        """Gets the help menu table for the given subgroup, or the main help menu if none is given.
+        Since the menus are static, each table is only built once, then cached."""
+        if (grid := self._help_tables.get(subgroup)) is None:
+            grid = self.make_new_help_table()
+            if subgroup is None:
+                grid.add_row('\\[h]elp', '', 'show help menu')
+                grid.add_row('\\[q]uit', '', 'exit the shell')
+                # TODO: global config?
+                # grid.add_row('config', 'view/edit the configurations')
+                self.add_board_help(grid)
+                self.add_project_help(grid)
+                self.add_task_help(grid)
+                # TODO: board config?
+            else:
+                getattr(self, f'add_{subgroup}_help')(grid)
+            self._help_tables[subgroup] = grid
+        return grid
+
     def show_help(self) -> None:
         """Displays the main help menu listing various commands."""
-        grid = self.make_new_help_table()
-        grid.add_row('\\[h]elp', '', 'show help menu')
-        grid.add_row('\\[q]uit', '', 'exit the shell')
-        # TODO: global config?
-        # grid.add_row('config', 'view/edit the configurations')
-        self.add_board_help(grid)
-        self.add_project_help(grid)
-        self.add_task_help(grid)
-        # TODO: board config?
-        print('[bold underline]User options[/]')
-        print(grid)
+        # render the heading and table in a single call
+        print('[bold underline]User options[/]', self._get_help_table())
 
     def _show_subgroup_help(self, subgroup: str) -> None:
-        grid = self.make_new_help_table()
-        meth = f'add_{subgroup}_help'
-        getattr(self, meth)(grid)
-        print(f'[bold underline]{subgroup.capitalize()} options[/]')
-        print(grid)
+        print(f'[bold underline]{subgroup.capitalize()} options[/]', self._get_help_table(subgroup))
 
     def show_board_help(self) -> None:
         """Displays the board-specific help menu."""
@@ -401,8 +512,9 @@ class BoardInterface:
 
     @staticmethod
     def show_schema(cls: type[Model], indent: int = 2) -> None:
-        """Prints out the JSON schema of the given type."""
-        print(json.dumps(cls.json_schema(mode='serialization'), indent=indent))
+        """Prints out the JSON schema of the given type.
+        This writes directly to stdout, bypassing rich's markup parsing, highlighting, and line wrapping."""
+        sys.stdout.write(get_schema_string(cls, indent) + '\n')
 
     @require_board
     def _update_project_or_task(self, id_or_name: str, field: str, value: Optional[str], is_task: bool) -> None:
@@ -440,7 +552,7 @@ class BoardInterface:
         """Deletes a project with the given ID or name."""
         assert self.board is not None
         if id_or_name is None:
-            id_or_name = simple_input('Project ID or name', match='.+')
+            id_or_name = simple_input('Project ID or name', match=NONEMPTY_INPUT)
         id_ = self._parse_project(id_or_name)
         assert id_ is not None
         proj = self.board.get_project(id_)
@@ -462,18 +574,7 @@ class BoardInterface:
     def new_project(self, name: Optional[str] = None) -> None:
         """Creates a new project."""
         assert self.board is not None
-        parsers = self._get_project_field_parsers(is_update=False)
-        prompts = {
-            'name': 'Project name',
-            'description': 'Description',
-            'links': 'Links [not bold]\\[optional, comma-separated][/]',
-        }
-        prompters: dict[str, FieldPrompter[Project, Any]] = {}
-        for (fld, prompt) in prompts.items():
-            kwargs: dict[str, Any] = {'prompt': prompt}
-            if fld in parsers:
-                kwargs['parse'] = parsers[fld]
-            prompters[fld] = FieldPrompter(Project, fld, **kwargs)
+        prompters = self._get_new_item_prompters(Project, NEW_PROJECT_PROMPTS, self._get_project_field_parsers)
         if name is None:
             defaults = {}
         else:
@@ -539,16 +640,8 @@ class BoardInterface:
                     raise TaskStatusError(f'cannot start a task before its creation time ({created_str})')
             return dt
         # if valid, prompt the user for when the action took place
-        # ask for time of intermediate status change, which occurs if:
-        #   todo -> active -> complete
-        #   todo -> active -> paused
-        #   paused -> active -> complete
-        intermediate_action_map = {
-            (TaskStatus.todo, TaskStatusAction.complete): TaskStatusAction.start,
-            (TaskStatus.todo, TaskStatusAction.pause): TaskStatusAction.start,
-            (TaskStatus.paused, TaskStatusAction.complete): TaskStatusAction.resume
-        }
-        if (intermediate := intermediate_action_map.get((task.status, action))):
+        # ask for time of intermediate status change, if there is one
+        if (intermediate := INTERMEDIATE_STATUS_ACTIONS.get((task.status, action))):
             prompt = f'When was the task {intermediate.past_tense()}? [not bold]\\[now][/] '
             prompter = Prompter(prompt, parse_datetime, validate=None, default=get_current_time)
             first_dt = prompter.loop_prompt(use_prompt_suffix=False, show_default=False)
@@ -609,18 +702,6 @@ class BoardInterface:
     def new_task(self, name: Optional[str] = None) -> None:
         """Creates a new task."""
         assert self.board is not None
-        parsers = self._get_task_field_parsers(is_update=False)
-        prompts = {
-            'name': 'Task name',
-            'description': 'Description',
-            'project_id': 'Project ID or name [not bold]\\[optional][/]',
-            'priority': 'Priority [not bold]\\[optional, 0-10][/]',
-            'expected_difficulty': 'Expected difficulty [not bold]\\[optional, 0-10][/]',
-            'expected_duration': 'Expected duration [not bold]\\[optional, e.g. "3 days", "2 months"][/]',
-            'due': 'Due date [not bold]\\[optional][/]',
-            'tags': 'Tags [not bold]\\[optional, comma-separated][/]',
-            'links': 'Links [not bold]\\[optional, comma-separated][/]',
-        }
         # only prompt for the fields specified in the configs
         task_fields = set(self.config.task.new_task_fields)
         if name is None:
@@ -628,13 +709,8 @@ class BoardInterface:
         else:
             task_fields.discard('name')
             defaults = {'name': validate_task_name(name)}
-        prompters: dict[str, FieldPrompter[Task, Any]] = {}
-        for (fld, prompt) in prompts.items():
-            if fld in task_fields:
-                kwargs: dict[str, Any] = {'prompt': prompt}
-                if fld in parsers:
-                    kwargs['parse'] = parsers[fld]
-                prompters[fld] = FieldPrompter(Task, fld, **kwargs)
+        prompts = {fld: prompt for (fld, prompt) in NEW_TASK_PROMPTS.items() if (fld in task_fields)}
+        prompters = self._get_new_item_prompters(Task, prompts, self._get_task_field_parsers)
         try:
             task = model_from_prompt(Task, prompters, defaults=defaults)
         except KeyboardInterrupt:  # go back to main REPL
@@ -649,14 +725,21 @@ class BoardInterface:
         assert self.board is not None
         return f'\\[{proj_id_style(id_)}] {self.board.get_project(id_).name}'
 
-    def _make_task_row(self, id_: Id, task: Task) -> TaskRow:
-        """Given a Task ID and object, gets a TaskRow object used for displaying the task in the task list."""
+    def _make_task_row(self, id_: Id, task: Task, project_strs: Optional[dict[Id, str]] = None) -> TaskRow:
+        """Given a Task ID and object, gets a TaskRow object used for displaying the task in the task list.
+        Optionally, a dict may be provided to cache the display strings of projects (which are shared by many tasks)."""
         assert self.board is not None
         def _get_proj(task: Task) -> Optional[str]:
-            return None if (task.project_id is None) else self._project_str_from_id(task.project_id)
+            if task.project_id is None:
+                return None
+            if project_strs is None:
+                return self._project_str_from_id(task.project_id)
+            if (proj_str := project_strs.get(task.project_id)) is None:
+                proj_str = project_strs[task.project_id] = self._project_str_from_id(task.project_id)
+            return proj_str
         def _get_date(dt: Optional[datetime]) -> Optional[str]:
             return None if (dt is None) else dt.strftime(self.config.time.date_format)
-        duration = None if (task.expected_duration is None) else pendulum.duration(days=task.expected_duration).in_words()
+        duration = None if (task.expected_duration is None) else duration_in_words(task.expected_duration)
         return TaskRow(
             id=task_id_style(id_, bold=True),
             name=task.name,
@@ -675,7 +758,8 @@ class BoardInterface:
     def show_tasks(self) -> None:
         """Shows task list."""
         assert self.board is not None
-        rows = [self._make_task_row(id_, task) for (id_, task) in self.board.tasks.items()]
+        project_strs: dict[Id, str] = {}
+        rows = [self._make_task_row(id_, task, project_strs) for (id_, task) in self.board.tasks.items()]
         if rows:
             table = make_table(TaskRow, rows)
             print(table)
@@ -722,7 +806,7 @@ class BoardInterface:
         assert self.board_path is not None
         path = path_style(self.board_path)
         if not self.board_path.exists():
-            raise BoardFileError(f'Board file {path_style(path)} does not exist')
+            raise BoardFileError(f'Board file {path} does not exist')
         delete = Confirm.ask(f'Are you sure you want to delete {path}?')
         if delete:
             self.board_path.unlink()
@@ -750,14 +834,17 @@ class BoardInterface:
         """Saves the state of the current board to its JSON file."""
         if self.board is not None:
             assert self.board_path is not None
-            if not self.board_path.parent.is_dir():
-                if self.board_path.parent.is_file():
-                    raise BoardFileError(f'{self.board_path.parent} is a file')
-                # parent directory doesn't exist, so create it
-                self.board_path.parent.mkdir(parents=True)
+            indent = self.config.file.json_indent
             try:
                 # TODO: save in background if file size starts to get large?
-                self.board.save(self.board_path, indent=self.config.file.json_indent)
+                try:
+                    self.board.save(self.board_path, indent=indent)
+                except FileNotFoundError:
+                    # parent directory doesn't exist, so create it
+                    self.board_path.parent.mkdir(parents=True)
+                    self.board.save(self.board_path, indent=indent)
+            except NotADirectoryError:
+                raise BoardFileError(f'{self.board_path.parent} is a file') from None
             except OSError as e:
                 raise BoardFileError(str(e)) from None
 
@@ -766,7 +853,7 @@ class BoardInterface:
         Implicitly loads that board afterward."""
         print('Creating new DaiKanban board.\n')
         def prompt_for_name(default: Optional[str]) -> str:
-            return simple_input('Board name', match=r'.*[^\s].*', default=default)
+            return simple_input('Board name', match=NONBLANK_INPUT, default=default)
         def prompt_for_path(default: Optional[str]) -> str:
             return simple_input('Output filename', default=default).strip()
         if name_or_path is None:  # prompt for name and path
@@ -939,7 +1026,9 @@ class BoardInterface:
         scorer = self.config.task.scorer
         (col_by_status, col_colors) = self._column_info(statuses)
         col_settings_by_col = self._get_column_settings_by_column(statuses=statuses, since=since)
-        task_rows_by_col = self._get_task_rows_by_column(statuses=statuses, projects=projects, tags=tags, since=since)
+        # evaluate time-dependent task info (scores, statuses, etc.) relative to a single current time
+        with frozen_current_time():
+            task_rows_by_col = self._get_task_rows_by_column(statuses=statuses, projects=projects, tags=tags, since=since)
         # count tasks in each column prior to limiting
         task_counts = {col: len(task_rows) for (col, task_rows) in task_rows_by_col.items()}
         if limit is not None:  # limit the number of tasks in each column
@@ -951,6 +1040,7 @@ class BoardInterface:
                 caption += f' ({scorer.description})'
         else:
             caption = None
+        from rich.table import Table  # imported lazily, since it is slow to load
         table = Table(title=self.board.name, title_style='bold italic blue', caption=caption)
         # make a subtable for each status column
         subtables = []
@@ -985,104 +1075,43 @@ class BoardInterface:
             value = tokens[2] if (ntokens >= 3) else None  # type: ignore[assignment]
         return {'id_or_name': id_or_name, 'field': field, 'value': value}
 
-    def evaluate_prompt(self, prompt: str) -> None:  # noqa: C901
+    def _parse_board_show_options(self, tokens: list[str]) -> dict[str, Any]:
+        """Parses '='-delimited arguments to 'board show' into keyword arguments for `show_board`."""
+        kwargs: dict[str, Any] = {}
+        for tok in tokens:
+            (key, val) = cast(tuple[str, str], parse_key_value_pair(tok, strict=True))
+            option = BOARD_SHOW_OPTIONS.get(key.lower())
+            if option in ['statuses', 'projects', 'tags']:
+                values = split_comma_list(val)
+                if not values:
+                    singular = 'status' if (option == 'statuses') else option[:-1]
+                    raise UserInputError(f'Must provide at least one {singular}')
+                kwargs[option] = values
+            elif option == 'limit':
+                kwargs['limit'] = parse_task_limit(val)
+            elif option == 'since':
+                none_vals = ['all', 'always', 'any', 'anytime']
+                kwargs['since'] = None if (val.strip().lower() in none_vals) else self.config.time.parse_datetime(val)
+            else:  # reject unknown keys
+                raise UserInputError(f'Invalid option: {key}')
+        return kwargs
+
+    def evaluate_prompt(self, prompt: str) -> None:
         """Given user prompt, takes a particular action."""
         prompt = prompt.strip()
         if not prompt:
             return None
-        tokens = shlex.split(prompt)
-        ntokens = len(tokens)
-        tok0 = tokens[0]
-        if prefix_match(tok0, 'board'):
-            if (ntokens == 1) or prefix_match(tokens[1], 'help'):
-                return self.show_board_help()
-            tok1 = tokens[1]
-            if prefix_match(tok1, 'delete'):
-                return self.delete_board()
-            if prefix_match(tok1, 'list', minlen=2):
-                return self.list_boards()
-            if prefix_match(tok1, 'load', minlen=2):
-                name_or_path = tokens[2] if (ntokens >= 3) else None
-                return self.load_board(name_or_path=name_or_path)
-            if prefix_match(tok1, 'new'):
-                name_or_path = tokens[2] if (ntokens >= 3) else None
-                return self.new_board(name_or_path=name_or_path)
-            if prefix_match(tok1, 'show'):
-                # parse '='-delimited arguments
-                d = dict([parse_key_value_pair(tok, strict=True) for tok in tokens[2:]])  # type: ignore[misc]
-                kwargs: dict[str, Any] = {}
-                _keys = set()
-                for (singular, plural) in [('status', 'statuses'), ('project', 'projects'), ('tag', 'tags')]:
-                    for (key, val) in d.items():
-                        key_lower = key.lower()
-                        if prefix_match(key_lower, singular, minlen=3) or prefix_match(key_lower, plural, minlen=3):
-                            values = split_comma_list(val)
-                            if not values:
-                                raise UserInputError(f'Must provide at least one {singular}')
-                            kwargs[plural] = values
-                        elif prefix_match(key_lower, 'limit', minlen=3):
-                            kwargs['limit'] = parse_task_limit(val)
-                        elif key_lower == 'since':
-                            none_vals = ['all', 'always', 'any', 'anytime']
-                            since = None if (val.strip().lower() in none_vals) else self.config.time.parse_datetime(val)
-                            kwargs['since'] = since
-                        else:
-                            continue
-                        _keys.add(key)
-                for key in d:
-                    if key not in _keys:  # reject unknown keys
-                        raise UserInputError(f'Invalid option: {key}')
-                return self.show_board(**kwargs)
-            if prefix_match(tok1, 'schema', minlen=2):
-                return self.show_schema(Board)
-        elif prefix_match(tok0, 'help') or (tok0 == 'info'):
-            return self.show_help()
-        elif prefix_match(tok0, 'project'):
-            if (ntokens == 1) or prefix_match(tokens[1], 'help'):
-                return self.show_project_help()
-            tok1 = tokens[1]
-            if prefix_match(tok1, 'new'):
-                return self.new_project(None if (ntokens == 2) else tokens[2])
-            if prefix_match(tok1, 'delete'):
-                return self.delete_project(None if (ntokens == 2) else tokens[2])
-            if prefix_match(tok1, 'show'):
-                if ntokens == 2:
-                    return self.show_projects()
-                return self.show_project(tokens[2])
-            if tok1 == 'set':
-                kwargs = self._parse_tokens_for_set_command(tokens[2:5])
-                return self.update_project(**kwargs)
-        elif prefix_match(tok0, 'quit') or (tok0 == 'exit'):
-            return self.quit_shell()
-        elif prefix_match(tok0, 'task'):
-            if (ntokens == 1) or prefix_match(tokens[1], 'help'):
-                return self.show_task_help()
-            tok1 = tokens[1]
-            if prefix_match(tok1, 'new'):
-                return self.new_task(None if (ntokens == 2) else tokens[2])
-            if prefix_match(tok1, 'delete'):
-                return self.delete_task(None if (ntokens == 2) else tokens[2])
-            if prefix_match(tok1, 'show'):
-                if ntokens == 2:
-                    return self.show_tasks()
-                return self.show_task(tokens[2])
-            if tok1 == 'set':
-                kwargs = self._parse_tokens_for_set_command(tokens[2:5])
-                return self.update_task(**kwargs)
-            action: Optional[TaskStatusAction] = None
-            if prefix_match(tok1, 'begin'):
-                # for convenience, use 'begin' instead of 'start' to avoid prefix collision with 'show'
-                action = TaskStatusAction.start
-            else:
-                for act in [TaskStatusAction.complete, TaskStatusAction.pause, TaskStatusAction.resume]:
-                    if prefix_match(tok1, act):
-                        action = act
-                        break
-            if action:
-                return self.change_task_status(action, None if (ntokens == 2) else tokens[2])
-            if prefix_match(tok1, 'todo'):
-                return self.todo_task(None if (ntokens == 2) else tokens[2])
-        raise UserInputError('Invalid input')
+        tokens = split_prompt(prompt)
+        if (cmd := MAIN_COMMANDS.get(tokens[0])) is None:
+            raise UserInputError('Invalid input')
+        if (subcommands := SUBCOMMANDS.get(cmd)) is None:
+            (subcmd, args) = (None, tokens[1:])
+        else:
+            subcmd = subcommands.get(tokens[1] if (len(tokens) >= 2) else 'help')
+            args = tokens[2:]
+        if (handler := COMMAND_HANDLERS.get((cmd, subcmd))) is None:
+            raise UserInputError('Invalid input')
+        return handler(self, args)
 
     @staticmethod
     def quit_shell() -> None:
@@ -1101,7 +1130,8 @@ class BoardInterface:
     def launch_shell(self, board_path: Optional[Path] = None) -> None:
         """Launches an interactive shell to interact with a board.
         Optionally a board path may be provided, which will be loaded after the shell launches."""
-        print(get_billboard_art())
+        # the art contains no markup, so bypass rich's rendering
+        sys.stdout.write(get_billboard_art() + '\n')
         print('[bold italic cyan]Welcome to DaiKanban![/]')
         print(style_str("Type 'h' for help.", DefaultColor.faint))
         if self.board_path is None:
@@ -1110,13 +1140,73 @@ class BoardInterface:
         if self.board_path:
             with logger.catch_errors(BoardFileError):
                 self.load_board(board_path)
-        try:
+        for prompt in self._read_prompts():
+            try:
+                self.evaluate_prompt(prompt)
+            except KanbanError as e:
+                print(err_style(e))
+            except KeyboardInterrupt:
+                print()
+                break
+        self.quit_shell()
+
+    @staticmethod
+    def _read_prompts() -> Iterator[str]:
+        """Yields lines of user input to the shell.
+        If stdin is a terminal, prompts interactively with readline support.
+        Otherwise (e.g. piped input), reads lines directly from stdin until it is exhausted.
+        Stops upon end of input or a keyboard interrupt."""
+        if sys.stdin.isatty():
+            import readline  # improves shell interactivity  # noqa: F401
             while True:
                 try:
                     prompt = input('🚀 ')
-                    self.evaluate_prompt(prompt)
-                except KanbanError as e:
-                    print(err_style(e))
-        except KeyboardInterrupt:
-            print()
-            self.quit_shell()
+                except (EOFError, KeyboardInterrupt):
+                    print()
+                    return
+                yield prompt
+        else:
+            with suppress(KeyboardInterrupt):
+                yield from sys.stdin
+
+
+####################
+# COMMAND HANDLERS #
+####################
+
+# function taking a BoardInterface and the remaining command arguments, which carries out a command
+CommandHandler = Callable[['BoardInterface', list[str]], None]
+
+def _first_arg(args: list[str]) -> Optional[str]:
+    return args[0] if args else None
+
+# map from (command, subcommand) to handler (the subcommand is None for commands without a group)
+COMMAND_HANDLERS: dict[tuple[str, Optional[str]], CommandHandler] = {
+    ('board', 'help'): lambda self, args: self.show_board_help(),
+    ('board', 'delete'): lambda self, args: self.delete_board(),
+    ('board', 'list'): lambda self, args: self.list_boards(),
+    ('board', 'load'): lambda self, args: self.load_board(name_or_path=_first_arg(args)),
+    ('board', 'new'): lambda self, args: self.new_board(name_or_path=_first_arg(args)),
+    ('board', 'show'): lambda self, args: self.show_board(**self._parse_board_show_options(args)),
+    ('board', 'schema'): lambda self, args: self.show_schema(Board),
+    ('help', None): lambda self, args: self.show_help(),
+    ('info', None): lambda self, args: self.show_help(),
+    ('project', 'help'): lambda self, args: self.show_project_help(),
+    ('project', 'new'): lambda self, args: self.new_project(_first_arg(args)),
+    ('project', 'delete'): lambda self, args: self.delete_project(_first_arg(args)),
+    ('project', 'show'): lambda self, args: self.show_project(args[0]) if args else self.show_projects(),
+    ('project', 'set'): lambda self, args: self.update_project(**self._parse_tokens_for_set_command(args[:3])),
+    ('quit', None): lambda self, args: self.quit_shell(),
+    ('exit', None): lambda self, args: self.quit_shell(),
+    ('task', 'help'): lambda self, args: self.show_task_help(),
+    ('task', 'new'): lambda self, args: self.new_task(_first_arg(args)),
+    ('task', 'delete'): lambda self, args: self.delete_task(_first_arg(args)),
+    ('task', 'show'): lambda self, args: self.show_task(args[0]) if args else self.show_tasks(),
+    ('task', 'set'): lambda self, args: self.update_task(**self._parse_tokens_for_set_command(args[:3])),
+    ('task', 'todo'): lambda self, args: self.todo_task(_first_arg(args)),
+}
+
+def _status_action_handler(action: TaskStatusAction) -> CommandHandler:
+    return lambda self, args: self.change_task_status(action, _first_arg(args))
+
+COMMAND_HANDLERS.update({('task', subcmd): _status_action_handler(action) for (subcmd, action) in TASK_STATUS_ACTIONS.items()})
@@ -8,7 +8,8 @@ from typing import IO, Any, ClassVar, Generic, Type, TypeVar, Union
 
 from typing_extensions import Self
 
-from daikanban.board import Board
+from daikanban.board import JSON_WRITE_BLOCK_SIZE, Board
+from daikanban.utils import join_in_blocks
 
 
 T = TypeVar('T')
@@ -119,8 +120,11 @@ class JSONWritable(JSONExportable, FileWritable[IO[str]]):
     """Base class for something that can write to a JSON file."""
 
     def write(self, fp: IO[str], **kwargs: Any) -> None:
-        """Writes to a JSON file."""
-        json.dump(self.to_json_obj(), fp, **kwargs)
+        """Writes to a JSON file.
+        Keyword arguments are the same as for `json.dump`, but rather than writing each small piece of JSON separately, this writes large blocks."""
+        encoder = kwargs.pop('cls', json.JSONEncoder)(**kwargs)
+        for block in join_in_blocks(encoder.iterencode(self.to_json_obj()), JSON_WRITE_BLOCK_SIZE):
+            fp.write(block)
 
 
 JR = TypeVar('JR', bound=JSONReadable)
@@ -1,21 +1,28 @@
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from contextlib import suppress
+from copy import copy
+from dataclasses import Field as DataclassField
 from dataclasses import fields
 from datetime import datetime, timedelta
+from functools import cache, cached_property, lru_cache
 import json
 from pathlib import Path
+import re
+import sys
 from typing import Annotated, Any, ClassVar, Optional, TypeVar, cast
 from urllib.parse import urlparse
 import uuid
 
 from fancy_dataclass import JSONBaseDataclass
-from pydantic import UUID4, AfterValidator, AnyUrl, BeforeValidator, Field, PlainSerializer, TypeAdapter, computed_field
+from fancy_dataclass.settings import FieldSettings
+from pydantic import UUID4, AfterValidator, AnyUrl, BeforeValidator, Field, PlainSerializer, TypeAdapter, ValidationInfo, computed_field
 from pydantic.dataclasses import dataclass
 from typing_extensions import Self, TypeAlias
 
-from daikanban.config import get_config
+from daikanban.config import Config, get_config
 from daikanban.errors import InconsistentTimestampError, TaskStatusError
 from daikanban.task import TaskStatus
-from daikanban.utils import StrEnum, get_current_time, get_duration_between, human_readable_duration, parse_string_set, style_str
+from daikanban.utils import StrEnum, frozen_current_time, get_current_time, get_duration_between, human_readable_duration, parse_string_set, style_str
 
 
 T = TypeVar('T')
@@ -30,20 +37,40 @@ NEARLY_DUE_THRESH = timedelta(days=1)
 
 Id: TypeAlias = Annotated[int, Field(ge=0)]
 
+_ASCII_LETTER = re.compile('[A-Za-z]')
+
 def _check_name(name: str) -> str:
-    if not any(c.isalpha() for c in name):
+    # most names contain an ASCII letter, which a regex search finds quickly; otherwise check for any Unicode letter
+    if (not _ASCII_LETTER.search(name)) and (not any(c.isalpha() for c in name)):
         raise ValueError('Name must have at least one letter')
     return name
 
+# web URL with an explicit scheme, capturing the host portion
+_WEB_URL_HOST = re.compile('https?://([^/?#]*)')
+
 def _check_url(url: Any) -> str:
-    parsed = urlparse(str(url))
+    url_str = str(url)
+    # fast path for the common case of a web URL with a dotted host (e.g. a link loaded from a board file)
+    if (match := _WEB_URL_HOST.match(url_str)) and ('.' in (host := match[1])) and ('[' not in host):
+        return url_str
+    parsed = urlparse(url_str)
     if (parsed.scheme in ['', 'http', 'https']) and ('.' not in parsed.netloc) and ('.' not in parsed.path):
         raise ValueError('Invalid URL')
     # if scheme is absent, assume https
-    return str(url) if parsed.scheme else f'https://{url}'
-
-def _parse_datetime(obj: str | datetime) -> datetime:
-    return get_config().time.parse_datetime(obj) if isinstance(obj, str) else obj
+    return url_str if parsed.scheme else f'https://{url_str}'
+
+@lru_cache(maxsize=8192)
+def _parse_iso_datetime(s: str) -> datetime:
+    # stored timestamps often recur (e.g. created/modified times), so cache the parsed values
+    return datetime.fromisoformat(s)
+
+def _parse_datetime(obj: str | datetime, info: ValidationInfo) -> datetime:
+    if isinstance(obj, str):
+        if info.mode == 'json':  # stored timestamps are in ISO format
+            with suppress(ValueError):
+                return _parse_iso_datetime(obj)
+        return get_config().time.parse_datetime(obj)
+    return obj
 
 def _render_datetime(dt: datetime) -> str:
     return get_config().time.render_datetime(dt)
@@ -59,8 +86,12 @@ def _parse_optional(obj: Any) -> Any:
 def _parse_str_set(obj: str | set[str]) -> set[str]:
     return (parse_string_set(obj) or set()) if isinstance(obj, str) else obj
 
+def _intern_str_set(strs: set[str]) -> set[str]:
+    # strings like tags recur across many objects, so share a single copy of each
+    return {sys.intern(s) for s in strs}
+
 def _parse_url_set(obj: str | set[str]) -> set[AnyUrl]:
-    if obj == '':
+    if not obj:  # empty string or collection
         return set()
     strings = parse_string_set(obj) if isinstance(obj, str) else obj
     return set(map(_check_url, strings))  # type: ignore[arg-type]
@@ -90,7 +121,7 @@ Score: TypeAlias = Annotated[float, Field(description='A score (positive number)
 
 OptionalScore: TypeAlias = Annotated[Optional[Score], BeforeValidator(_parse_optional)]
 
-StrSet: TypeAlias = Annotated[set[str], BeforeValidator(_parse_str_set)]
+StrSet: TypeAlias = Annotated[set[str], BeforeValidator(_parse_str_set), AfterValidator(_intern_str_set)]
 
 UrlSet: TypeAlias = Annotated[set[Url], BeforeValidator(_parse_url_set)]
 
@@ -130,8 +161,10 @@ def cmd_style(cmd: str) -> str:
     """Renders a command as a rich-styled string."""
     return style_str(cmd, DefaultColor.cmd)
 
+@cache
 def status_style(status: TaskStatus) -> str:
-    """Renders a TaskStatus as a rich-styled string with the appropriate color."""
+    """Renders a TaskStatus as a rich-styled string with the appropriate color.
+    Since there are only a handful of statuses, the results are cached."""
     return style_str(status, status.color)
 
 
@@ -146,11 +179,9 @@ class ModelJSONEncoder(_BaseEncoder):  # type: ignore[misc, valid-type]
 
     def default(self, obj: Any) -> Any:
         """Customizes JSON encoding so that sets can be represented as lists."""
-        if isinstance(obj, AnyUrl):
-            return str(obj)
-        if isinstance(obj, uuid.UUID):
+        if isinstance(obj, (uuid.UUID, AnyUrl)):
             return str(obj)
-        if isinstance(obj, set):
+        if isinstance(obj, (set, frozenset)):
             return sorted(obj)
         return super().default(obj)
 
@@ -166,34 +197,89 @@ class Model(JSONBaseDataclass, suppress_none=True, store_type='off', validate=Fa
         return val is not None
 
     @classmethod
+    @cache
+    def _field_settings(cls, field: DataclassField) -> FieldSettings:  # type: ignore[type-arg]
+        """Gets the settings extracted from a field's metadata, caching the result.
+        Otherwise these would be rebuilt (and type-checked) for every field of every object converted to or from a dict."""
+        return super()._field_settings(field)
+
+    @classmethod
+    @cache
+    def _get_flattened_field_names(cls) -> set[str]:
+        """Gets the set of flattened field names, caching the result.
+        The result should not be mutated."""
+        return super()._get_flattened_field_names()
+
+    @classmethod
+    @cache
+    def _type_adapter(cls) -> TypeAdapter[Any]:
+        """Gets a TypeAdapter for the class, caching the result."""
+        return TypeAdapter(cls)
+
+    @classmethod
+    @cache
     def _computed_fields(cls) -> list[str]:
-        """Gets the list of computed fields (properties marked with the `computed_field` decorator)."""
-        schema = TypeAdapter(cls).core_schema['schema']
+        """Gets the list of computed fields (properties marked with the `computed_field` decorator).
+        The result is cached per class, so it should not be mutated."""
+        schema = cls._type_adapter().core_schema['schema']
         while 'schema' in schema:  # weirdly, 'dataclass-args' schema may be nested in a 'dataclass' schema
             schema = schema['schema']
         return [d['property_name'] for d in schema.get('computed_fields', [])]
 
+    def _pretty_value(self, config: Config, field: str, val: Any) -> str:
+        """Gets a pretty value (as a string) for a given field and value."""
+        return config.pretty_value(val)
+
     def _pretty_dict(self) -> dict[str, str]:
         """Gets a dict from fields to pretty values (as strings)."""
         config = get_config()
-        return {
-            **{field: config.pretty_value(val) for (field, val) in self.to_dict().items() if self._include_field(field, val)},
-            **{field: config.pretty_value(val) for field in self._computed_fields() if self._include_field(field, (val := getattr(self, field)))}
-        }
+        d: dict[str, str] = {}
+        for (field, val) in self.to_dict().items():
+            if self._include_field(field, val):
+                d[field] = self._pretty_value(config, field, val)
+        for field in self._computed_fields():
+            if self._include_field(field, (val := getattr(self, field))):
+                d[field] = self._pretty_value(config, field, val)
+        return d
 
     @classmethod
     def json_schema(cls, **kwargs: Any) -> dict[str, Any]:
         """Produces a JSON schema based on the Model subtype."""
-        return TypeAdapter(cls).json_schema(**kwargs)
+        return cls._type_adapter().json_schema(**kwargs)
+
+    @classmethod
+    @cache
+    def _field_names(cls) -> tuple[str, ...]:
+        """Gets the names of the dataclass fields, caching the result."""
+        return tuple(fld.name for fld in fields(cls))  # type: ignore[arg-type]
 
     def _replace(self, **kwargs: Any) -> Self:
-        d = {fld.name: getattr(self, fld.name) for fld in fields(self)}  # type: ignore[arg-type]
+        names = self._field_names()
+        if (unknown := kwargs.keys() - self.__dataclass_fields__.keys()):  # type: ignore[attr-defined]
+            key = next(key for key in kwargs if key in unknown)
+            raise TypeError(f'Unknown field {key!r}')
+        d = {name: getattr(self, name) for name in names}
+        d.update(kwargs)
+        return type(self)(**d)
+
+    @classmethod
+    @cache
+    def _cached_properties(cls) -> tuple[str, ...]:
+        """Gets the names of any cached properties on the class (whose values get stored on the instance)."""
+        return tuple(name for base in cls.__mro__ for (name, val) in vars(base).items() if isinstance(val, cached_property))
+
+    def _replace_unvalidated(self, **kwargs: Any) -> Self:
+        """Like _replace, but skips validation of the new object.
+        This should only be used for internal updates whose new values are already known to be valid (as opposed to user input)."""
+        obj = copy(self)
+        # discard cached properties, which may depend on the replaced fields
+        for key in self._cached_properties():
+            obj.__dict__.pop(key, None)
         for (key, val) in kwargs.items():
-            if key in d:
-                d[key] = val
-            else:
+            if key not in self.__dataclass_fields__:  # type: ignore[attr-defined]
                 raise TypeError(f'Unknown field {key!r}')
-        return type(self)(**d)
+            object.__setattr__(obj, key, val)
+        return obj
 
     @classmethod
     def json_encoder(cls) -> type[json.JSONEncoder]:
@@ -210,10 +296,16 @@ class TaskStatusAction(StrEnum):
 
     def past_tense(self) -> str:
         """Gets the action in the past tense."""
-        if self == TaskStatusAction.start:
-            return 'started'
-        return f'{self}d'
+        return _ACTION_PAST_TENSES[self]
+
 
+# mapping from action to its past tense (defined outside the enum, since class attributes would become members)
+_ACTION_PAST_TENSES = {
+    TaskStatusAction.start: 'started',
+    TaskStatusAction.complete: 'completed',
+    TaskStatusAction.pause: 'paused',
+    TaskStatusAction.resume: 'resumed'
+}
 
 # mapping from action to resulting status
 STATUS_ACTION_MAP = {
@@ -240,8 +332,21 @@ class Relation(Model):
     )
 
     def _map_id(self, id_map: Mapping[Id, Id]) -> Self:
-        """Given a mapping from old IDs to new ones, applies that mapping to the destination."""
-        return self._replace(dest=id_map.get(self.dest, self.dest))
+        """Given a mapping from old IDs to new ones, applies that mapping to the destination.
+        If the destination is unchanged, returns the same object."""
+        dest = id_map.get(self.dest, self.dest)
+        return self if (dest == self.dest) else self._replace_unvalidated(dest=dest)
+
+
+def _map_relation_ids(relations: Optional[list[Relation]], id_map: Mapping[Id, Id]) -> Optional[list[Relation]]:
+    """Given a list of relations and a mapping from old IDs to new ones, applies that mapping to each relation.
+    Returns None if no relation changes."""
+    if not relations:
+        return None
+    new_relations = [relation._map_id(id_map) for relation in relations]
+    if all(new is old for (new, old) in zip(new_relations, relations)):
+        return None
+    return new_relations
 
 
 @dataclass(frozen=True)
@@ -293,14 +398,15 @@ class Project(Model):
         return self._replace(modified_time=dt or get_current_time())
 
     def _map_project_ids(self, proj_id_map: Mapping[Id, Id]) -> Self:
-        """Given a mapping from old project IDs to new ones, applies that mapping to any stored IDs."""
+        """Given a mapping from old project IDs to new ones, applies that mapping to any stored IDs.
+        If no IDs change, returns the same object."""
         kwargs: dict[str, Any] = {}
-        if self.parent is not None:
-            kwargs['parent'] = proj_id_map.get(self.parent, self.parent)
-        if self.relations:
-            # TODO: could relations contain anything other than projects? If so, handle them separately.
-            kwargs['relations'] = [relation._map_id(proj_id_map) for relation in self.relations]
-        return self._replace(**kwargs) if kwargs else self
+        if (self.parent is not None) and ((parent := proj_id_map.get(self.parent, self.parent)) != self.parent):
+            kwargs['parent'] = parent
+        # TODO: could relations contain anything other than projects? If so, handle them separately.
+        if (relations := _map_relation_ids(self.relations, proj_id_map)) is not None:
+            kwargs['relations'] = relations
+        return self._replace_unvalidated(**kwargs) if kwargs else self
 
 
 @dataclass(frozen=True)
@@ -421,9 +527,10 @@ class Task(Model):
     )
 
     # fields that are reset to None when a Task is reset
-    RESET_FIELDS: ClassVar[list[str]] = ['due_time', 'first_started_time', 'last_started_time', 'last_paused_time', 'completed_time', 'completed_time', 'prior_time_worked', 'blocked_by', 'parent', 'logs']
+    RESET_FIELDS: ClassVar[list[str]] = ['due_time', 'first_started_time', 'last_started_time', 'last_paused_time', 'completed_time', 'prior_time_worked', 'blocked_by', 'parent', 'logs']
+    _RESET_KWARGS: ClassVar[dict[str, None]] = dict.fromkeys(RESET_FIELDS)
     # fields whose type is duration
-    DURATION_FIELDS: ClassVar[list[str]] = ['expected_duration', 'prior_time_worked', 'lead_time', 'cycle_time', 'total_time_worked']
+    DURATION_FIELDS: ClassVar[frozenset[str]] = frozenset(['expected_duration', 'prior_time_worked', 'lead_time', 'cycle_time', 'total_time_worked'])
 
     def __post_init__(self) -> None:
         self.check_consistent_times()
@@ -431,23 +538,24 @@ class Task(Model):
     def _include_field(self, field: str, val: Any) -> bool:
         return (val is not None) or (field == 'project_id')
 
+    def _pretty_value(self, config: Config, field: str, val: Any) -> str:
+        if (field in self.DURATION_FIELDS) and (val is not None):
+            # make durations human-readable
+            assert isinstance(val, float)
+            return '-' if (val == 0) else human_readable_duration(val)
+        return super()._pretty_value(config, field, val)
+
     def _pretty_dict(self) -> dict[str, str]:
         d = super()._pretty_dict()
-        for field in self.DURATION_FIELDS:
-            # make durations human-readable
-            if field in d:
-                val = getattr(self, field)
-                if (val is not None):
-                    assert isinstance(val, float)
-                    d[field] = '-' if (val == 0) else human_readable_duration(val)
         if self.project_id is None:
             d['project_id'] = '-'
         return d
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def status(self) -> TaskStatus:
-        """Gets the current status of the task."""
+        """Gets the current status of the task.
+        Since tasks are immutable, this is computed at most once per instance."""
         if self.first_started_time is None:
             return TaskStatus.todo
         if self.last_paused_time is not None:
@@ -530,30 +638,31 @@ class Task(Model):
         If any is invalid, raises an InconsistentTimestampError."""
         def _invalid(msg: str) -> InconsistentTimestampError:
             return InconsistentTimestampError(f'{msg}\n\t{self}')
-        if self.first_started_time is not None:
-            if self.first_started_time < self.created_time:
-                raise _invalid('Task start time cannot precede created time')
-        if self.last_started_time is not None:
-            if self.first_started_time is None:
-                raise _invalid('Task missing first started time')
-            if self.last_started_time < self.first_started_time:
-                raise _invalid('Task last started time cannot precede first started time')
-        if self.last_paused_time is not None:
-            if self.first_started_time is None:
+        # this runs on every Task construction, so look up each timestamp only once
+        first_started_time = self.first_started_time
+        last_started_time = self.last_started_time
+        last_paused_time = self.last_paused_time
+        completed_time = self.completed_time
+        if first_started_time is None:  # a task that has not started has no other status timestamps
+            if (last_started_time is not None) or (last_paused_time is not None) or (completed_time is not None):
                 raise _invalid('Task missing first started time')
-            if self.last_started_time is not None:
+            return self
+        if first_started_time < self.created_time:
+            raise _invalid('Task start time cannot precede created time')
+        if (last_started_time is not None) and (last_started_time < first_started_time):
+            raise _invalid('Task last started time cannot precede first started time')
+        if last_paused_time is not None:
+            if last_started_time is not None:
                 raise _invalid('Task cannot have both a last started and last paused time')
-            if self.last_paused_time < self.first_started_time:
+            if last_paused_time < first_started_time:
                 raise _invalid('Task last paused time cannot precede first started time')
-        if self.completed_time is not None:
-            if self.first_started_time is None:
-                raise _invalid('Task missing first started time')
-            if self.completed_time < self.first_started_time:
+        if completed_time is not None:
+            if completed_time < first_started_time:
                 raise _invalid('Task completed time cannot precede first started time')
-            if self.last_started_time and (self.completed_time < self.last_started_time):
+            if last_started_time and (completed_time < last_started_time):
                 raise _invalid('Task completed time cannot precede last started time')
         # task is paused or completed => task has prior time worked
-        if (self.status == TaskStatus.paused) and (self.prior_time_worked is None):
+        if (last_paused_time is not None) and (self.prior_time_worked is None):
             raise _invalid('Task in paused or completed status must set prior time worked')
         return self
 
@@ -571,7 +680,7 @@ class Task(Model):
             if dt < self.created_time:
                 dt_str = get_config().time.render_datetime(self.created_time)
                 raise TaskStatusError(f'cannot start a task before its creation time ({dt_str})')
-            return self._replace(first_started_time=dt, modified_time=cur_time)
+            return self._replace_unvalidated(first_started_time=dt, modified_time=cur_time)
         raise TaskStatusError(f"cannot start task with status '{self.status}'")
 
     def completed(self, dt: Optional[datetime] = None) -> Self:
@@ -583,7 +692,7 @@ class Task(Model):
             last_started_time = cast(datetime, self.last_started_time or self.first_started_time)
             if dt < last_started_time:
                 raise TaskStatusError('cannot complete a task before its last started time')
-            return self._replace(completed_time=dt, modified_time=cur_time)
+            return self._replace_unvalidated(completed_time=dt, modified_time=cur_time)
         raise TaskStatusError(f"cannot complete task with status '{self.status}'")
 
     def paused(self, dt: Optional[datetime] = None) -> Self:
@@ -597,7 +706,7 @@ class Task(Model):
                 raise TaskStatusError('cannot pause a task before its last started time')
             dur = 0.0 if (self.prior_time_worked is None) else self.prior_time_worked
             dur += get_duration_between(last_started_time, dt)
-            return self._replace(last_started_time=None, last_paused_time=dt, prior_time_worked=dur, modified_time=cur_time)
+            return self._replace_unvalidated(last_started_time=None, last_paused_time=dt, prior_time_worked=dur, modified_time=cur_time)
         raise TaskStatusError(f"cannot pause task with status '{self.status}'")
 
     def resumed(self, dt: Optional[datetime] = None) -> Self:
@@ -611,53 +720,77 @@ class Task(Model):
                 assert self.last_paused_time is not None
                 if dt < self.last_paused_time:
                     raise TaskStatusError('cannot resume a task before its last paused time')
-                return self._replace(last_started_time=dt, last_paused_time=None, modified_time=cur_time)
+                return self._replace_unvalidated(last_started_time=dt, last_paused_time=None, modified_time=cur_time)
             else:  # complete
                 assert self.completed_time is not None
                 if dt < self.completed_time:
                     raise TaskStatusError('cannot resume a task before its completed time')
-                return self._replace(last_started_time=dt, prior_time_worked=self.total_time_worked, completed_time=None, modified_time=cur_time)
+                return self._replace_unvalidated(last_started_time=dt, prior_time_worked=self.total_time_worked, completed_time=None, modified_time=cur_time)
         raise TaskStatusError(f"cannot resume task with status '{self.status}'")
 
+    def _start_action(self, dt: Optional[datetime], first_dt: Optional[datetime]) -> Self:
+        """Applies the start action."""
+        return self.started(dt=dt)
+
+    def _complete_action(self, dt: Optional[datetime], first_dt: Optional[datetime]) -> Self:
+        """Applies the complete action, first starting or resuming the task if necessary."""
+        status = self.status
+        if status == TaskStatus.todo:
+            with frozen_current_time():
+                return self.started(dt=first_dt).completed(dt=dt)
+        if status == TaskStatus.paused:
+            with frozen_current_time():
+                return self.resumed(dt=first_dt).completed(dt=dt)
+        return self.completed(dt=dt)
+
+    def _pause_action(self, dt: Optional[datetime], first_dt: Optional[datetime]) -> Self:
+        """Applies the pause action, first starting the task if necessary."""
+        if self.status == TaskStatus.todo:
+            with frozen_current_time():
+                return self.started(dt=first_dt).paused(dt=dt)
+        return self.paused(dt=dt)
+
+    def _resume_action(self, dt: Optional[datetime], first_dt: Optional[datetime]) -> Self:
+        """Applies the resume action."""
+        return self.resumed(dt=dt)
+
     def apply_status_action(self, action: TaskStatusAction, dt: Optional[datetime] = None, first_dt: Optional[datetime] = None) -> Self:
         """Applies a status action to the task, returning the new task.
             dt: datetime at which the action occurred (if consisting of two consecutive actions, the latter one)
             first_dt: if the action consists of two consecutive actions, the datetime at which the first action occurred
-        If the action is invalid for the task's current state, raises a TaskStatusError."""
-        if action == TaskStatusAction.start:
-            return self.started(dt=dt)
-        if action == TaskStatusAction.complete:
-            if self.status == TaskStatus.todo:
-                return self.started(dt=first_dt).completed(dt=dt)
-            if self.status in [TaskStatus.active, TaskStatus.complete]:
-                return self.completed(dt=dt)
-            assert self.status == TaskStatus.paused
-            return self.resumed(dt=first_dt).completed(dt=dt)
-        if action == TaskStatusAction.pause:
-            if self.status == TaskStatus.todo:
-                return self.started(dt=first_dt).paused(dt=dt)
-            return self.paused(dt=dt)
-        assert action == TaskStatusAction.resume
-        return self.resumed(dt=dt)
+        If the action is invalid for the task's current state, raises a TaskStatusError.
+        When two consecutive actions are applied, the current time is read only once and shared between them."""
+        return cast(Self, _TASK_ACTION_HANDLERS[action](self, dt, first_dt))
 
     def reset(self) -> Self:
         """Resets a task to the 'todo' state, regardless of its current state.
         This will preserve the original creation metadata except for timestamps, due time, blocking tasks, and logs."""
-        kwargs: dict[str, Any] = {field: None for field in self.RESET_FIELDS}
-        kwargs['modified_time'] = get_current_time()
-        return self._replace(**kwargs)
+        return self._replace_unvalidated(**self._RESET_KWARGS, modified_time=get_current_time())
 
     def _map_project_ids(self, proj_id_map: Mapping[Id, Id]) -> Self:
-        """Given a mapping from old project IDs to new ones, applies that mapping to any stored project IDs."""
-        return self if (self.project_id is None) else self._replace(project_id=proj_id_map.get(self.project_id, self.project_id))
+        """Given a mapping from old project IDs to new ones, applies that mapping to any stored project IDs.
+        If no IDs change, returns the same object."""
+        if (self.project_id is None) or ((project_id := proj_id_map.get(self.project_id, self.project_id)) == self.project_id):
+            return self
+        return self._replace_unvalidated(project_id=project_id)
 
     def _map_task_ids(self, task_id_map: Mapping[Id, Id]) -> Self:
-        """Given a mapping from old task IDs to new ones, applies that mapping to any stored task IDs."""
+        """Given a mapping from old task IDs to new ones, applies that mapping to any stored task IDs.
+        If no IDs change, returns the same object."""
         kwargs: dict[str, Any] = {}
-        if self.blocked_by:
+        if self.blocked_by and any(task_id_map.get(id_, id_) != id_ for id_ in self.blocked_by):
             kwargs['blocked_by'] = {task_id_map.get(id_, id_) for id_ in self.blocked_by}
-        if self.parent is not None:
-            kwargs['parent'] = task_id_map.get(self.parent, self.parent)
-        if self.relations:
-            kwargs['relations'] = [relation._map_id(task_id_map) for relation in self.relations]
-        return self._replace(**kwargs) if kwargs else self
+        if (self.parent is not None) and ((parent := task_id_map.get(self.parent, self.parent)) != self.parent):
+            kwargs['parent'] = parent
+        if (relations := _map_relation_ids(self.relations, task_id_map)) is not None:
+            kwargs['relations'] = relations
+        return self._replace_unvalidated(**kwargs) if kwargs else self
+
+
+# mapping from status action to the Task method which applies it
+_TASK_ACTION_HANDLERS: dict[TaskStatusAction, Callable[[Task, Optional[datetime], Optional[datetime]], Task]] = {
+    TaskStatusAction.start: Task._start_action,
+    TaskStatusAction.complete: Task._complete_action,
+    TaskStatusAction.pause: Task._pause_action,
+    TaskStatusAction.resume: Task._resume_action
+}
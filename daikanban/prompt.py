@@ -1,11 +1,12 @@
 from dataclasses import MISSING, dataclass
+from functools import cache, lru_cache
 import re
-from typing import Any, Callable, Generic, Optional, TextIO, TypeVar
+from typing import Any, Callable, Generic, Optional, TextIO, TypeVar, cast
 
 from pydantic import TypeAdapter, ValidationError
 import rich
 from rich.prompt import Prompt
-from rich.text import TextType
+from rich.text import Text, TextType
 
 from daikanban.errors import UserInputError
 from daikanban.utils import err_style
@@ -30,16 +31,37 @@ class Console(rich.console.Console):
         return input(prompt_str)
 
 
+@cache
+def _get_console() -> Console:
+    """Gets the Console used for prompting, creating it on the first call."""
+    return Console()
+
+
 class PromptNoSuffix(Prompt):
     """Subclass of Prompt which suppresses the prompt suffix (colon)."""
     prompt_suffix = ''
 
 
-def simple_input(prompt: str, default: Optional[str] = None, match: str = '.*') -> str:
-    """Prompts the user with the given string until the user's response matches a certain regex."""
+# common patterns for simple_input
+ANY_INPUT = re.compile('.*')
+NONEMPTY_INPUT = re.compile('.+')
+NONBLANK_INPUT = re.compile(r'.*[^\s].*')
+
+
+@lru_cache(maxsize=256)
+def _prompt_text(prompt: str) -> Text:
+    """Renders a prompt string (which may contain rich markup) as bold prompt text, caching the result.
+    This is what rich's Prompt would do with the string on every call; sharing the Text is safe since Prompt copies it before appending to it."""
+    return Text.from_markup(f'[bold]{prompt}[/]', style='prompt')
+
+def simple_input(prompt: str, default: Optional[str] = None, match: str | re.Pattern[str] = ANY_INPUT) -> str:
+    """Prompts the user with the given string until the user's response matches a certain regex.
+    The regex may be given either as a string or a precompiled pattern (re keeps its own bounded cache of compiled strings)."""
     regex = re.compile(match)
+    # the prompt is invariant across attempts, so create it once
+    rich_prompt = Prompt(_prompt_text(prompt), console=_get_console())
     while True:
-        result = Prompt.ask(f'[bold]{prompt}[/]', default=default, console=Console()) or ''
+        result = rich_prompt(default=default) or ''
         if regex.fullmatch(result):
             break
     return result
@@ -51,7 +73,7 @@ def validated_input(prompt: str, validator: Callable[[str], T], default: Any = N
         default: default value
         use_prompt_suffix: displays the default prompt suffix (colon) after the prompt and default
         print_error: if True, displays an error message upon each failed iteration of input
-        kwargs: passed to the rich prompt"""
+        kwargs: passed to the rich prompt constructor"""
     if default == MISSING:
         default = None
     if default:
@@ -59,8 +81,10 @@ def validated_input(prompt: str, validator: Callable[[str], T], default: Any = N
             default = int(default)
         default = str(default)
     prompt_cls = Prompt if use_prompt_suffix else PromptNoSuffix
+    # the prompt is invariant across attempts, so create it once
+    rich_prompt = prompt_cls(_prompt_text(prompt), console=_get_console(), **kwargs)
     while True:
-        result = prompt_cls.ask(f'[bold]{prompt}[/]', default=default, console=Console(), **kwargs) or ''
+        result = rich_prompt(default=default) or ''
         try:
             return validator(result)
         except Exception as e:
@@ -90,6 +114,12 @@ class Prompter(Generic[T]):
         return validated_input(self.prompt, self.parse_and_validate, default=default, **kwargs)
 
 
+@cache
+def _get_field_validator(model_type: type, field: str) -> TypeAdapter[Any]:
+    """Gets a TypeAdapter for validating values of a given dataclass field, caching the result."""
+    return TypeAdapter(model_type.__dataclass_fields__[field].type)  # type: ignore[attr-defined]
+
+
 @dataclass
 class FieldPrompter(Generic[M, T]):
     """Class which prompts a user for input associated with a given dataclass field, then parses and validates the response."""
@@ -115,7 +145,7 @@ class FieldPrompter(Generic[M, T]):
         """Validates the field value."""
         if val == MISSING:
             raise UserInputError('This field is required')
-        validator = TypeAdapter(self.field_info.type)
+        validator = _get_field_validator(cast(type, self.model_type), self.field)
         try:
             validator.validate_python(val)
         except ValidationError as e:
@@ -129,7 +159,9 @@ class FieldPrompter(Generic[M, T]):
 
 def model_from_prompt(model_type: type[M], prompters: dict[str, FieldPrompter[M, Any]] = {}, defaults: dict[str, Any] = {}) -> M:  # noqa: B006
     """Given a model type and collection of FieldPrompters, constructs an instance of the type from a sequence of user prompts.
-    A collection of defaults may also be provided for any fields which are missing a prompter."""
+    A collection of defaults may also be provided for any fields which are missing a prompter.
+    NOTE: each prompted value has only been validated against its own field type, so the model is still constructed with full validation.
+    Its model-level validators (e.g. consistency between timestamps) and any unprompted defaults are only checked here."""
     kwargs: dict[str, Any] = dict(defaults)
     for (field, prompter) in prompters.items():
         kwargs[field] = prompter.prompt_field()
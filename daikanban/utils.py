@@ -1,11 +1,14 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 import csv
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import cache, lru_cache
 import operator
 import re
-from typing import Any, Callable, Iterable, Optional, cast
+import sys
+from typing import Any, Callable, Iterable, Iterator, Optional, cast
 
-import pendulum
 from typing_extensions import TypeAlias
 
 from daikanban.errors import UserInputError
@@ -44,29 +47,24 @@ NotGiven = NotGivenType.NotGiven
 def to_snake_case(name: str) -> str:
     """Converts an arbitrary string to snake case."""
     name = name.replace('"', '').replace("'", '')
-    return re.sub(r'[^\w]+', '_', name.strip()).lower()
-
-def prefix_match(token: str, match: str, minlen: int = 1) -> bool:
-    """Returns True if token is a prefix of match and has length at least minlen."""
-    n = len(token)
-    return (n >= minlen) and (match[:n] == token)
+    return _NON_WORD_CHARS.sub('_', name.strip()).lower()
+
+def make_prefix_map(words: Iterable[str | tuple[str, int]]) -> dict[str, str]:
+    """Given a sequence of words, returns a dict mapping every prefix of each word to the word itself.
+    Each entry may also be a pair (word, minlen), in which case only prefixes of length at least minlen are included (default 1).
+    If a prefix is shared by multiple words, the earliest word takes precedence.
+    The words are interned, so comparing a looked-up value against a string literal hits the identity fast path."""
+    prefix_map: dict[str, str] = {}
+    for entry in words:
+        (word, minlen) = (entry, 1) if isinstance(entry, str) else entry
+        word = sys.intern(word)
+        for i in range(minlen, len(word) + 1):
+            prefix_map.setdefault(word[:i], word)
+    return prefix_map
 
 def convert_number_words_to_digits(s: str) -> str:
     """Replaces occurrences of number words like 'one', 'two', etc. to their digital equivalents."""
-    words_to_numbers = {
-        'zero': '0',
-        'one': '1',
-        'two': '2',
-        'three': '3',
-        'four': '4',
-        'five': '5',
-        'six': '6',
-        'seven': '7',
-        'eight': '8',
-        'nine': '9',
-    }
-    pattern = re.compile(r'\b(' + '|'.join(words_to_numbers.keys()) + r')\b')
-    return re.sub(pattern, lambda x: words_to_numbers[x.group()], s)
+    return _NUMBER_WORD_EXPR.sub(lambda x: _NUMBER_WORDS[x.group()], s)
 
 # function which matches a queried name against an existing name
 NameMatcher: TypeAlias = Callable[[str, str], bool]
@@ -76,15 +74,19 @@ def whitespace_insensitive_match(name1: str, name2: str) -> bool:
     """Matches two strings, leading/trailing-whitespace-insensitively."""
     return name1.strip() == name2.strip()
 
+def fold_name(name: str) -> str:
+    """Normalizes a name for case-insensitive matching, by stripping whitespace and case-folding."""
+    return name.strip().casefold()
+
 def case_insensitive_match(name1: str, name2: str) -> bool:
     """Matches two strings, case- and leading/trailing-whitespace-insensitively."""
-    return name1.strip().casefold() == name2.strip().casefold()
+    return fold_name(name1) == fold_name(name2)
 
 def fuzzy_match(name1: str, name2: str) -> bool:
     """Matches a queried name against a stored name, case-insensitively.
     This allows the first string to be a prefix of the second, if it is at least three characters long."""
-    s1 = name1.strip().casefold()
-    s2 = name2.strip().casefold()
+    s1 = fold_name(name1)
+    s2 = fold_name(name2)
     return (s1 == s2) or ((len(s1) >= 3) and s2.startswith(s1))
 
 def first_name_match(matcher: NameMatcher, name1: str, names2: Iterable[str]) -> Optional[str]:
@@ -95,7 +97,27 @@ def parse_string_set(s: str) -> Optional[set[str]]:
     """Parses a comma-separated string into a set of strings.
     Allows for quote delimiting so that commas can be escaped.
     Strips any leading or trailing whitespace from each string."""
-    return {string.strip() for string in list(csv.reader([s]))[0]} or None
+    if not s:
+        return None
+    # the CSV parser is only needed if some field starts with a quote, or there are line breaks
+    if s.startswith('"') or (',"' in s) or ('\n' in s) or ('\r' in s):
+        return {string.strip() for string in next(csv.reader([s]))} or None
+    return {string.strip() for string in s.split(',')}
+
+def join_in_blocks(chunks: Iterable[str], block_size: int) -> Iterator[str]:
+    """Concatenates a stream of strings into blocks of at least block_size characters (except possibly the last one).
+    This is useful for writing many small pieces of output (e.g. from a JSON encoder) with fewer, larger writes."""
+    block: list[str] = []
+    size = 0
+    for chunk in chunks:
+        block.append(chunk)
+        size += len(chunk)
+        if size >= block_size:
+            yield ''.join(block)
+            block.clear()
+            size = 0
+    if block:
+        yield ''.join(block)
 
 def parse_key_value_pair(s: str, strict: bool = False) -> Optional[tuple[str, str]]:
     """If the given string is of the form [KEY]=[VALUE], returns a tuple (KEY, VALUE).
@@ -123,6 +145,20 @@ def count_fmt(n: int, name: str, plural_suffix: str = 's', plural_form: Optional
             name = plural_form
     return f'{n} {name}'
 
+_NON_WORD_CHARS = re.compile(r'[^\w]+')
+_NUMBER_WORDS = {
+    'zero': '0',
+    'one': '1',
+    'two': '2',
+    'three': '3',
+    'four': '4',
+    'five': '5',
+    'six': '6',
+    'seven': '7',
+    'eight': '8',
+    'nine': '9',
+}
+_NUMBER_WORD_EXPR = re.compile(r'\b(' + '|'.join(_NUMBER_WORDS) + r')\b')
 _EQUALS_EXPR = re.compile(r'(\w+)\s*=\s*(.*)')
 
 
@@ -130,29 +166,65 @@ _EQUALS_EXPR = re.compile(r'(\w+)\s*=\s*(.*)')
 # DATETIME #
 ############
 
+# current time fixed by frozen_current_time (if any)
+_FROZEN_TIME: ContextVar[Optional[datetime]] = ContextVar('frozen_time', default=None)
+
 def get_current_time() -> datetime:
-    """Gets the current time (timezone-aware)."""
-    return datetime.now(timezone.utc).astimezone()
+    """Gets the current time (timezone-aware).
+    Within a frozen_current_time context, this is the time at which the outermost such context was entered."""
+    return _FROZEN_TIME.get() or datetime.now(timezone.utc).astimezone()
+
+@contextmanager
+def frozen_current_time() -> Iterator[datetime]:
+    """Context manager which fixes the value of get_current_time for the duration of the context.
+    This is useful when evaluating many time-dependent quantities (e.g. task scores) at once, so that they are mutually consistent and the clock is only read once."""
+    now = get_current_time()
+    token = _FROZEN_TIME.set(now)
+    try:
+        yield now
+    finally:
+        _FROZEN_TIME.reset(token)
 
 def get_duration_between(dt1: datetime, dt2: datetime) -> float:
     """Gets the duration (in days) between two datetimes."""
     return (dt2 - dt1).total_seconds() / SECS_PER_DAY
 
+@lru_cache(maxsize=1024)
+def duration_in_words(days: float) -> str:
+    """Given a duration (in days), renders it in words as a sequence of weeks, days, hours, minutes, and seconds, e.g. "1 week 3 days 12 hours".
+    This produces the same output as pendulum's `Duration.in_words`, without constructing a Duration.
+    As with pendulum, a negative duration is broken down by its magnitude, with each nonzero unit negated, e.g. "-1 day -12 hours"."""
+    dur = timedelta(days=days)
+    sign = '-' if (dur < timedelta(0)) else ''
+    dur = abs(dur)
+    (weeks, rem_days) = divmod(dur.days, DAYS_PER_WEEK)
+    (hours, rem_secs) = divmod(dur.seconds, SECS_PER_HOUR)
+    (minutes, seconds) = divmod(rem_secs, 60)
+    units = [(weeks, 'week'), (rem_days, 'day'), (hours, 'hour'), (minutes, 'minute'), (seconds, 'second')]
+    if (s := ' '.join(sign + count_fmt(n, unit) for (n, unit) in units if n)):
+        return s
+    if dur.microseconds:
+        return f'{dur.microseconds / 1e6:.2f} seconds'
+    return '0 microseconds'
+
 def human_readable_duration(days: float, prefer_days: bool = False) -> str:
     """Given a duration (in days), converts it to a human-readable string.
     This goes out to minute precision only.
     If prefer_days=True, show days and not weeks."""
     if days == 0:
         return '0 seconds'
-    dur = pendulum.Duration(days=days)
-    s = dur.in_words()
+    s = duration_in_words(days)
     if prefer_days and ('week' in s):
-        s = re.sub(r'\d+ weeks?( \d+ days?)?', f'{dur.days} days', s)
+        s = _WEEKS_DAYS_EXPR.sub(f'{timedelta(days=days).days} days', s)
     # hacky way to truncate the seconds
-    return re.sub(r'\s+\d+ seconds?', '', s)
+    return _SECONDS_EXPR.sub('', s)
+
+_WEEKS_DAYS_EXPR = re.compile(r'\d+ weeks?( \d+ days?)?')
+_SECONDS_EXPR = re.compile(r'\s+\d+ seconds?')
 
 def replace_relative_day(s: str) -> str:
     """Given a time string containing yesterday/today/tomorrow, or an expression like "last Friday" or "next Tuesday", replaces it with the appropriate date."""
+    import pendulum  # imported lazily, since it is slow to load
     pattern1 = '(yesterday|today|tomorrow)'
     def replace1(match: re.Match[str]) -> str:
         now = pendulum.now()
@@ -181,6 +253,7 @@ def replace_relative_day(s: str) -> str:
 
 def replace_relative_time_expression(s: str) -> str:
     """Resolves a relative time expression to an absolute one."""
+    import pendulum  # imported lazily, since it is slow to load
     s = replace_relative_day(s)
     pattern = r'(in\s+)?(\d+)\s+(sec(ond)?|min(ute)?|hr|hour|day|week|month|yr|year)s?(\s+(ago|from\s+now))?'
     def replace(match: re.Match[str]) -> str:
@@ -216,18 +289,25 @@ def replace_relative_time_expression(s: str) -> str:
 # STYLE #
 #########
 
+@cache
+def _style_tag(color: str, bold: bool, italic: bool) -> str:
+    """Gets the opening rich markup tag for a given color, bold, and italic settings."""
+    tags = [('' if bold else 'not ') + 'bold', ('' if italic else 'not ') + 'italic', color]
+    return '[' + ' '.join(tags) + ']'
+
 def style_str(val: Any, color: str, bold: bool = False, italic: bool = False) -> str:
     """Renders a value as a rich-formatted string with a given color, bold, and italic settings."""
-    tags = [('' if bold else 'not ') + 'bold', ('' if italic else 'not ') + 'italic', color]
-    tag = ' '.join(tags)
-    return f'[{tag}]{val}[/]'
+    return f'{_style_tag(color, bold, italic)}{val}[/]'
+
+_ERR_TAG = _style_tag('red', False, False)
 
 def err_style(obj: object) -> str:
-    """Renders an error as a rich-styled string."""
+    """Renders an error as a rich-styled string.
+    NOTE: error messages may themselves contain rich markup, so the result is still parsed as markup when printed."""
     s = str(obj)
     if s:
         s = s[0].upper() + s[1:]
-    return style_str(s, 'red')
+    return f'{_ERR_TAG}{s}[/]'
 
 
 ########
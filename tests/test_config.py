@@ -5,7 +5,7 @@ from pathlib import Path
 from pydantic import ValidationError
 import pytest
 
-from daikanban.config import DEFAULT_DATE_FORMAT, Config, TaskConfig, TimeConfig, get_config, user_config_path, user_dir
+from daikanban.config import DEFAULT_DATE_FORMAT, Config, TaskConfig, TimeConfig, _parse_seconds, get_config, user_config_path, user_dir
 from daikanban.task import DEFAULT_TASK_SCORER_NAME, TASK_SCORERS, TaskScorer
 from daikanban.utils import HOURS_PER_DAY, SECS_PER_DAY, UserInputError, get_current_time
 
@@ -157,6 +157,48 @@ class TestTimeConfig:
         else:
             assert dt < now
 
+    @pytest.mark.parametrize('string', [
+        '2024-03-05',
+        '2024-03-05 14:30',
+        '2024-03-05T14:30:00',
+        '2024-03-05T14:30:00+02:00',
+        '2024-07-05 9',
+        'March 5, 2024',
+    ])
+    def test_parse_absolute_time(self, string):
+        """Tests that absolute times parse the same way with or without the ISO 8601 shortcut."""
+        import pendulum
+        config = get_config().time
+        dt = config.parse_datetime(string)
+        assert dt.tzinfo is not None
+        expected = pendulum.parse(string.replace(' 9', ' 09'), strict=False, tz=pendulum.local_timezone())  # type: ignore[operator]
+        assert isinstance(expected, datetime)
+        assert dt == expected
+        assert dt.utcoffset() == expected.utcoffset()
+
+    @pytest.mark.parametrize(['string', 'expected_iso'], [
+        ('2024-03-10 02:30', '2024-03-10T03:30:00-04:00'),  # skipped by spring-forward
+        ('2024-11-03 01:30', '2024-11-03T01:30:00-05:00'),  # repeated by fall-back
+        ('2024-03-10T02:30:00', '2024-03-10T03:30:00-04:00'),
+        ('2024-06-01 12:00', '2024-06-01T12:00:00-04:00'),
+    ])
+    def test_parse_time_across_dst(self, monkeypatch, string, expected_iso):
+        """Tests that naive times at DST transitions parse the same way with or without the ISO 8601 shortcut."""
+        import time
+
+        import pendulum
+        monkeypatch.setenv('TZ', 'America/New_York')
+        time.tzset()
+        try:
+            with pendulum.test_local_timezone(pendulum.timezone('America/New_York')):
+                dt = get_config().time.parse_datetime(string)
+                expected = pendulum.parse(string, strict=False, tz=pendulum.local_timezone())  # type: ignore[operator]
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        assert isinstance(expected, datetime)
+        assert dt.isoformat() == expected.isoformat() == expected_iso
+
     @pytest.mark.parametrize(['string', 'days'], VALID_DURATIONS)
     def test_parse_duration_valid(self, string, days):
         config = get_config().time
@@ -164,6 +206,24 @@ class TestTimeConfig:
         assert isinstance(dur, float)
         assert dur == pytest.approx(days)
 
+    @pytest.mark.parametrize('string', ['3 days', '3days', '1 w', '2 HOURS', '1.5 weeks', '10.1 d', '0.25 sec', '2.5 s', '007 mins', '1.5 hr', '1h30m', '1.5 mo', '-3 days', '2 years'])
+    def test_parse_seconds(self, string):
+        """Tests that the fast path for simple durations agrees exactly with pytimeparse."""
+        import pytimeparse  # type: ignore[import-untyped]
+        secs = _parse_seconds(string)
+        expected = pytimeparse.parse(string)
+        assert secs == expected
+        assert type(secs) is type(expected)
+
+    def test_parse_duration_work_time(self):
+        """Tests that parsed durations depend on the work time settings (even though parsing is cached)."""
+        config = TimeConfig(hours_per_work_day=8, days_per_work_week=5)
+        assert config.parse_duration('1 workday') == pytest.approx(1 / 3)
+        assert config.parse_duration('1 work week') == pytest.approx(5 / 3)
+        config = TimeConfig(hours_per_work_day=6, days_per_work_week=4)
+        assert config.parse_duration('1 workday') == pytest.approx(1 / 4)
+        assert config.parse_duration('1 work week') == pytest.approx(1)
+
     @pytest.mark.parametrize('string', INVALID_DURATIONS)
     def test_parse_duration_invalid(self, string):
         config = get_config().time
@@ -186,6 +246,21 @@ class TestTaskConfig:
 
 class TestConfig:
 
+    @pytest.mark.parametrize(['val', 'pretty'], [
+        (None, '-'),
+        ('abc', 'abc'),
+        (3, '3'),
+        (3.0, '3'),
+        (-2.0, '-2'),
+        (0.12345, '0.123'),
+        (float('inf'), 'inf'),
+        (float('nan'), 'nan'),
+        ([1.0, 2.5], '1, 2.5'),
+        ({'b', 'a'}, 'a, b'),
+    ])
+    def test_pretty_value(self, val, pretty):
+        assert get_config().pretty_value(val) == pretty
+
     def test_global_config(self):
         dt = date(2024, 1, 1)
         def _pretty_value(val):
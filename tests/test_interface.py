@@ -1,4 +1,6 @@
 from contextlib import suppress
+import json
+import shlex
 import shutil
 
 from pydantic_core import Url
@@ -6,8 +8,8 @@ import pytest
 
 from daikanban.board import Board
 from daikanban.config import get_config
-from daikanban.errors import BoardNotLoadedError, TaskStatusError
-from daikanban.interface import BoardInterface, parse_string_set
+from daikanban.errors import BoardFileError, BoardNotLoadedError, TaskStatusError
+from daikanban.interface import COMMAND_HANDLERS, MAIN_COMMANDS, SUBCOMMANDS, BoardInterface, get_billboard_art, get_field_prompter, get_schema_string, parse_string_set, split_prompt
 from daikanban.model import Project, Task, TaskStatusAction
 from daikanban.utils import UserInputError, get_current_time
 
@@ -29,11 +31,59 @@ def new_board():
     ('a b', {'a b'}),
     ('"a, b"', {'a, b'}),
     ("'a, b'", {"'a", "b'"}),
+    ('a"b, c', {'a"b', 'c'}),
+    ('a,"b, c"', {'a', 'b, c'}),
+    ('a, "b, c"', {'a', '"b', 'c"'}),
+    ('a, "b" c', {'a', '"b" c'}),
 ])
 def test_parse_string_set(s, parsed):
     assert parse_string_set(s) == parsed
 
 
+def test_command_handlers():
+    """Tests that every command reachable through the prefix maps has a handler, and vice versa."""
+    reachable: set[tuple[str, str | None]] = set()
+    for cmd in set(MAIN_COMMANDS.values()):
+        if cmd in SUBCOMMANDS:
+            reachable.update((cmd, subcmd) for subcmd in set(SUBCOMMANDS[cmd].values()))
+        else:
+            reachable.add((cmd, None))
+    assert reachable == set(COMMAND_HANDLERS)
+
+@pytest.mark.parametrize('prompt', [
+    'task show',
+    '  task   new\tmy-task ',
+    'task new "my task"',
+    "task new 'my task' now",
+    'task new my\\ task',
+    'task new a\x0cb',
+    'task new caf\u00e9\u00a0bar',
+])
+def test_split_prompt(prompt):
+    assert split_prompt(prompt) == shlex.split(prompt)
+
+@pytest.mark.parametrize('indent', [0, 2])
+def test_get_schema_string(indent):
+    schema = get_schema_string(Board, indent)
+    assert schema == json.dumps(Board.json_schema(mode='serialization'), indent=indent)
+    assert get_schema_string(Board, indent) is schema
+
+def test_get_field_prompter():
+    prompter = get_field_prompter(Task, 'tags', 'Tags', parse_string_set)
+    assert get_field_prompter(Task, 'tags', 'Tags', parse_string_set) is prompter
+    assert get_field_prompter(Task, 'tags', 'Other', parse_string_set) is not prompter
+    # prompters whose parsers are bound methods are not shared
+    interface = BoardInterface(board=new_board())
+    prompter = get_field_prompter(Task, 'project_id', 'Project', interface._parse_project)
+    assert get_field_prompter(Task, 'project_id', 'Project', interface._parse_project) is not prompter
+    # but an interface reuses its own prompters for new items
+    prompts = {'name': 'Task name', 'project_id': 'Project ID or name [not bold]\\[optional][/]'}
+    prompters = interface._get_new_item_prompters(Task, prompts, interface._get_task_field_parsers)
+    assert list(prompters) == list(prompts)
+    for (fld, prompter) in interface._get_new_item_prompters(Task, prompts, interface._get_task_field_parsers).items():
+        assert prompter is prompters[fld]
+
+
 class TestInterface:
 
     @staticmethod
@@ -78,6 +128,24 @@ class TestInterface:
         """Tests output of various shell help commands."""
         self._test_output(capsys, None, [(cmd, None)], regex)
 
+    @pytest.mark.parametrize('cmd', ['fake', 'board fake', 'project fake', 'task fake', 'task st', 'board l'])
+    def test_invalid_input(self, cmd):
+        """Tests that unrecognized (or ambiguous) commands are rejected."""
+        with pytest.raises(UserInputError, match='Invalid input'):
+            BoardInterface(board=new_board()).evaluate_prompt(cmd)
+
+    def test_launch_shell_piped(self, capsys, monkeypatch):
+        """Tests that the shell reads commands from non-interactive stdin until it is exhausted."""
+        patch_stdin(monkeypatch, 'help\nfake\ntask help\n')
+        with pytest.raises(SystemExit) as exc_info:
+            BoardInterface(board=new_board()).launch_shell()
+        assert exc_info.value.code == 0
+        res = capsys.readouterr()
+        assert res.out.startswith(get_billboard_art() + '\n')
+        # the art is only read from disk once
+        assert get_billboard_art() is get_billboard_art()
+        match_patterns([r'User options', r'Invalid input', r'Task options', r'Goodbye!'], res.out)
+
     # PROJECT
 
     def test_project_show_empty(self, capsys):
@@ -439,6 +507,23 @@ class TestInterface:
         self._test_output(capsys, monkeypatch, [('board new', ['board1', '', ''])], out=out, interface=BoardInterface())
         assert (board_dir / 'board1.json').exists()
 
+    def test_board_save_invalid_path(self, tmp_path):
+        """Tests that saving a board whose parent path is a file raises a BoardFileError."""
+        parent = tmp_path / 'parent'
+        parent.touch()
+        interface = BoardInterface(board_path=parent / 'board.json', board=new_board())
+        with pytest.raises(BoardFileError, match='is a file'):
+            interface.save_board()
+
+    def test_board_delete_missing_file(self, tmp_path, monkeypatch):
+        """Tests that deleting a board whose file is missing raises a BoardFileError without prompting."""
+        interface = BoardInterface(board_path=tmp_path / 'board.json', board=new_board())
+        def _fail_ask(*args, **kwargs):
+            raise AssertionError('unexpected confirmation prompt')
+        monkeypatch.setattr('daikanban.interface.Confirm.ask', _fail_ask)
+        with pytest.raises(BoardFileError, match='does not exist'):
+            interface.delete_board()
+
     def test_board_show_empty(self, capsys):
         """Tests 'board show' when there are no tasks."""
         self._test_output(capsys, None, [('board show', None)], out=r'\[No tasks\]')
@@ -34,6 +34,9 @@ class TestImportExport:
         # output JSON is just the serialized board
         assert (TEST_DATA_DIR / filename).read_text() == test_board.to_json_string()
         self._test_import_is_faithful(test_board, ImportFormat.daikanban.importer, filename)
+        # json.load options are accepted
+        board = ImportFormat.daikanban.importer.import_board(TEST_DATA_DIR / filename, parse_float=float)
+        assert board == test_board
 
     def test_export_taskwarrior(self, test_board, tmp_path):
         filename = 'taskwarrior.export.json'
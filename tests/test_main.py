@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+import subprocess
 import sys
 
 import pytest
@@ -41,6 +42,13 @@ class TestMain:
         for cmd in [[], ['--help']]:
             self._test_main(capsys, cmd, out_patterns=patterns)
 
+    def test_lazy_imports(self):
+        """Tests that importing the CLI app does not load the board model or interface modules."""
+        code = 'import sys; import daikanban.cli.main; print(sorted(m for m in sys.modules if m.startswith("daikanban.")))'
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        for mod in ['daikanban.board', 'daikanban.interface', 'daikanban.io', 'daikanban.model']:
+            assert repr(mod) not in out
+
     def test_version(self, capsys):
         """Tests that the --version flag prints out the current version."""
         self._test_main(capsys, ['--version'], f'{__version__}\n', exact=True)
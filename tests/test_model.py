@@ -1,5 +1,7 @@
 from copy import deepcopy
 from datetime import datetime, timedelta
+import stat
+from urllib.parse import urlparse
 import uuid
 
 from pydantic import ValidationError
@@ -9,14 +11,44 @@ import pytest
 from daikanban.board import Board, load_board
 from daikanban.config import DEFAULT_DATETIME_FORMAT, get_config
 from daikanban.errors import AmbiguousProjectNameError, AmbiguousTaskNameError, DuplicateProjectError, ProjectNotFoundError, TaskNotFoundError, TaskStatusError, UUIDImmutableError, VersionMismatchError
-from daikanban.model import Project, Relation, Task, TaskStatus, TaskStatusAction
+from daikanban.model import Project, Relation, Task, TaskStatus, TaskStatusAction, _check_url
 from daikanban.task import TASK_SCORERS
-from daikanban.utils import case_insensitive_match, fuzzy_match, get_current_time
+from daikanban.utils import case_insensitive_match, first_name_match, fuzzy_match, get_current_time
 
 
 always_match = lambda s1, s2: True
 
 
+@pytest.mark.parametrize('url', [
+    'https://example.com', 'http://example.com/path', 'https://localhost/a.b', 'https://localhost', 'http://x?q=a.b', 'https://a#b.c',
+    'https://[::1].com', 'https://user@example.com:8080/', 'HTTPS://EXAMPLE.COM', 'example.com', 'example', 'ftp://x', 'https:/x.com',
+])
+def test_check_url(url):
+    """Tests that URL checking (which has a fast path for common web URLs) agrees with the general method."""
+    def _check_url_slow(url):
+        parsed = urlparse(url)
+        if (parsed.scheme in ['', 'http', 'https']) and ('.' not in parsed.netloc) and ('.' not in parsed.path):
+            raise ValueError('Invalid URL')
+        return url if parsed.scheme else f'https://{url}'
+    try:
+        expected = _check_url_slow(url)
+    except ValueError as e:
+        with pytest.raises(ValueError, match=str(e)):
+            _check_url(url)
+    else:
+        assert _check_url(url) == expected
+
+@pytest.mark.parametrize(['action', 'past_tense'], [
+    (TaskStatusAction.start, 'started'),
+    (TaskStatusAction.complete, 'completed'),
+    (TaskStatusAction.pause, 'paused'),
+    (TaskStatusAction.resume, 'resumed'),
+])
+def test_action_past_tense(action, past_tense):
+    assert action.past_tense() == past_tense
+    assert TaskStatusAction(str(action)).past_tense() == past_tense
+
+
 class TestProject:
 
     def test_links(self):
@@ -26,6 +58,8 @@ class TestProject:
         assert proj.links == set()
         proj = Project(name='proj', links=set())
         assert proj.links == set()
+        proj = Project(name='proj', links=[])
+        assert proj.links == set()
         with pytest.raises(ValidationError, match='Invalid URL'):
             proj = Project(name='proj', links={''})
         with pytest.raises(ValidationError, match='Invalid URL'):
@@ -90,6 +124,9 @@ class TestTask:
         assert Task(name='task', tags='a').tags == {'a'}
         assert Task(name='task', tags='a,b').tags == {'a', 'b'}
         assert Task(name='task', tags=' a,  b').tags == {'a', 'b'}
+        # tags are interned
+        tag = 'tag'
+        assert next(iter(Task(name='task', tags=''.join(['t', 'ag'])).tags)) is tag
 
     def test_replace(self):
         now = get_current_time()
@@ -113,6 +150,12 @@ class TestTask:
             _ = Task(name='1')
         with pytest.raises(ValidationError):
             _ = Task(name='.')
+        # non-ASCII letters count, but other non-ASCII characters do not
+        _ = Task(name='\u00e9t\u00e9')
+        _ = Task(name='\u4efb\u52a1')
+        for name in ['\u00b2', '\u00bd', '\u2167', '\u0663']:
+            with pytest.raises(ValidationError):
+                _ = Task(name=name)
 
     def test_valid_duration(self):
         task = Task(name='task', expected_duration=None)
@@ -135,6 +178,10 @@ class TestTask:
     def test_schema(self):
         computed_fields = ['status', 'lead_time', 'cycle_time', 'total_time_worked', 'is_overdue']
         assert Task._computed_fields() == computed_fields
+        # TypeAdapter and computed fields are cached per class
+        assert Task._type_adapter() is Task._type_adapter()
+        assert Task._computed_fields() is Task._computed_fields()
+        assert Project._computed_fields() == []
         schema = Task.json_schema(mode='serialization')
         # FIXME: computed fields should not be required?
         assert schema['required'] == ['name'] + computed_fields
@@ -144,6 +191,7 @@ class TestTask:
     def test_status(self):
         todo = Task(name='task')
         assert todo.status == TaskStatus.todo == 'todo'
+        assert todo.__dict__['status'] == TaskStatus.todo  # status is cached
         assert todo.first_started_time is None
         assert todo.last_paused_time is None
         assert todo.completed_time is None
@@ -184,6 +232,16 @@ class TestTask:
         assert isinstance(resumed.last_started_time, datetime)
         assert resumed.last_paused_time is None
         assert resumed.completed_time is None
+        # transitions skip validation, but produce valid tasks
+        for task in [started, paused, paused.resumed(), completed, resumed]:
+            assert task._replace() == task
+        with pytest.raises(TypeError, match='Unknown field'):
+            _ = todo._replace_unvalidated(fake_field=None)
+        # consecutive actions share the same current time
+        for (task, action) in [(todo, TaskStatusAction.complete), (paused, TaskStatusAction.complete), (todo, TaskStatusAction.pause)]:
+            new_task = task.apply_status_action(action)
+            assert new_task._replace() == new_task
+            assert new_task.modified_time == (new_task.completed_time or new_task.last_paused_time)
 
     def test_reset(self):
         def _reset_task_is_equal(task1, task2):
@@ -203,6 +261,29 @@ class TestTask:
         assert _reset_task_is_equal(completed, todo)
         assert completed.reset().status == TaskStatus.todo
 
+    def test_map_ids(self):
+        task = Task(name='task', project_id=0, blocked_by={1, 2}, parent=3, relations=[Relation(type='rel', dest=4)])
+        # identity mappings return the same object
+        for id_map in [{}, {0: 0, 1: 1, 2: 2, 3: 3, 4: 4}, {5: 6}]:
+            assert task._map_project_ids(id_map) is task
+            assert task._map_task_ids(id_map) is task
+        bare_task = Task(name='task')
+        assert bare_task._map_project_ids({0: 1})._map_task_ids({0: 1}) is bare_task
+        task2 = task._map_project_ids({0: 10})
+        assert task2.project_id == 10
+        assert task2.blocked_by == {1, 2}
+        task3 = task._map_task_ids({1: 11, 4: 14})
+        assert task3.project_id == 0
+        assert task3.blocked_by == {11, 2}
+        assert task3.parent == 3
+        assert task3.relations == [Relation(type='rel', dest=14)]
+        assert task.blocked_by == {1, 2}
+        proj = Project(name='proj', parent=0, relations=[Relation(type='rel', dest=1)])
+        assert proj._map_project_ids({0: 0, 2: 3}) is proj
+        proj2 = proj._map_project_ids({0: 5})
+        assert proj2.parent == 5
+        assert proj2.relations is proj.relations
+
     def test_timestamps(self):
         dt = get_current_time()
         # a task started in the future is permitted
@@ -226,6 +307,24 @@ class TestTask:
             with pytest.raises(ValidationError, match='Invalid time'):
                 _ = Task(name='task', created_time=val)
 
+    @pytest.mark.parametrize(['offsets', 'msg'], [
+        ({'last_started_time': 1}, 'missing first started time'),
+        ({'last_paused_time': 1}, 'missing first started time'),
+        ({'completed_time': 1}, 'missing first started time'),
+        ({'first_started_time': 2, 'last_started_time': 1}, 'last started time cannot precede first started time'),
+        ({'first_started_time': 1, 'last_started_time': 2, 'last_paused_time': 3}, 'both a last started and last paused time'),
+        ({'first_started_time': 2, 'last_paused_time': 1}, 'last paused time cannot precede first started time'),
+        ({'first_started_time': 2, 'completed_time': 1}, 'completed time cannot precede first started time'),
+        ({'first_started_time': 1, 'last_started_time': 3, 'completed_time': 2}, 'completed time cannot precede last started time'),
+        ({'first_started_time': 1, 'last_paused_time': 2}, 'must set prior time worked'),
+        ({'first_started_time': 1, 'last_paused_time': 2, 'completed_time': 0.5}, 'completed time cannot precede first started time'),
+    ])
+    def test_inconsistent_timestamps(self, offsets, msg):
+        dt = get_current_time()
+        kwargs = {field: dt + timedelta(days=offset) for (field, offset) in offsets.items()}
+        with pytest.raises(ValidationError, match=msg):
+            _ = Task(name='task', created_time=dt, **kwargs)
+
     def test_modified_time(self):
         dt = get_current_time()
         task = Task(name='task')
@@ -291,10 +390,45 @@ class TestBoard:
         board_path = tmp_path / 'board.json'
         board.save(board_path)
         assert board_path.exists()
-        for loaded_board in [Board.load(board_path), load_board(board_path)]:
+        assert board_path.read_text() == board.to_json_string()
+        board.save(board_path, indent=2)
+        assert board_path.read_text() == board.to_json_string(indent=2)
+        assert [p.name for p in tmp_path.iterdir()] == ['board.json']  # no temporary file left behind
+        with open(board_path) as f:
+            board_from_file = Board.load(f)
+        for loaded_board in [Board.load(board_path), load_board(board_path), board_from_file]:
             assert loaded_board == board
             assert loaded_board._project_uuid_to_id == board._project_uuid_to_id
             assert loaded_board._task_uuid_to_id == board._task_uuid_to_id
+            # stored timestamps are parsed as plain ISO datetimes
+            assert type(loaded_board.created_time) is datetime
+            assert loaded_board.created_time.tzinfo is None
+        # repeated timestamps share the same parsed datetime
+        assert Board.load(board_path).created_time is Board.load(board_path).created_time
+
+    @pytest.mark.parametrize('block_size', [1, 16, 1 << 16])
+    def test_save_in_blocks(self, monkeypatch, tmp_path, block_size):
+        """Tests that streaming a board to a file in blocks produces the same JSON as rendering it all at once."""
+        monkeypatch.setattr('daikanban.board.JSON_WRITE_BLOCK_SIZE', block_size)
+        board = Board(name='myboard', projects={0: Project(name='proj')}, tasks={0: Task(name='task', project_id=0)})
+        board_path = tmp_path / 'board.json'
+        for indent in [None, -1, 2]:
+            board.save(board_path, indent=indent)
+            assert board_path.read_text() == board.to_json_string(indent=indent)
+
+    def test_save_keeps_file_mode_and_symlink(self, tmp_path):
+        """Tests that saving over an existing board keeps its permissions, and replaces the target of a symlink rather than the link."""
+        board = Board(name='myboard')
+        board_path = tmp_path / 'board.json'
+        board_path.write_text('{}')
+        board_path.chmod(0o640)
+        link_path = tmp_path / 'link.json'
+        link_path.symlink_to(board_path)
+        board.save(link_path)
+        assert link_path.is_symlink()
+        assert board_path.read_text() == board.to_json_string()
+        assert stat.S_IMODE(board_path.stat().st_mode) == 0o640
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['board.json', 'link.json']
 
     def test_project_ids(self):
         board = Board(name='myboard')
@@ -308,6 +442,19 @@ class TestBoard:
         assert board.new_project_id() == 3
         board.projects[100] = Project(name='proj100')
         assert board.new_project_id() == 3
+        # deleted IDs are reused
+        board.delete_project(0)
+        assert board.new_project_id() == 0
+        assert board.create_project(Project(name='proj0')) == 0
+        assert board.new_project_id() == 3
+        board.clear()
+        assert board.new_project_id() == 0
+        # deleted task IDs are reused, smallest first
+        for i in range(5):
+            assert board.create_task(Task(name=f'task{i}')) == i
+        board.delete_task(3)
+        board.delete_task(1)
+        assert [board.create_task(Task(name=f'new{i}')) for i in range(3)] == [1, 3, 5]
 
     def test_invalid_ids(self):
         board = Board(name='myboard')
@@ -377,6 +524,21 @@ class TestBoard:
         with pytest.raises(DuplicateProjectError, match='Duplicate project UUID'):
             board.create_project(proj0)
 
+    def test_new_uuids(self, monkeypatch):
+        board = Board(name='myboard')
+        # new UUIDs are generated without looping, even for an empty board
+        assert board.new_project_uuid() not in board._project_uuid_to_id
+        assert board.new_task_uuid() not in board._task_uuid_to_id
+        board.create_project(Project(name='proj'))
+        board.create_task(Task(name='task'))
+        # a newly generated UUID that collides with an existing one is skipped
+        used = [next(iter(board._project_uuid_to_id)), next(iter(board._task_uuid_to_id))]
+        fresh = uuid.uuid4()
+        for (i, new_uuid) in enumerate([board.new_project_uuid, board.new_task_uuid]):
+            uuids = iter([used[i], fresh])
+            monkeypatch.setattr('uuid.uuid4', lambda: next(uuids))  # noqa: B023
+            assert new_uuid() == fresh
+
     def test_crud_project(self):
         board = Board(name='myboard')
         with pytest.raises(ProjectNotFoundError):
@@ -425,6 +587,14 @@ class TestBoard:
         board.add_blocking_task(0, 1)
         assert task1.blocked_by is None  # no mutation on original task
         assert board.get_task(1).blocked_by == {0}
+        # adding an existing blocking task does nothing
+        task = board.get_task(1)
+        board.add_blocking_task(0, 1)
+        assert board.get_task(1) is task
+        board.create_task(Task(name='task2'))
+        board.add_blocking_task(2, 1)
+        assert board.get_task(1).blocked_by == {0, 2}
+        assert task.blocked_by == {0}
 
     def test_duplicate_project_names(self, capsys):
         board = Board(name='myboard')
@@ -533,6 +703,80 @@ class TestBoard:
             assert board.get_task_id_by_name('Task0') == 4
             assert board.get_task_id_by_name('Task0', case_insensitive_match) == 4
 
+    def test_name_index(self):
+        """Tests that name lookups stay correct as projects and tasks are renamed or deleted."""
+        board = Board(name='myboard', projects={0: Project(name='proj0')}, tasks={0: Task(name='task0')})
+        assert board.get_project_id_by_name('proj0') == 0
+        assert board.get_task_id_by_name('task0') == 0
+        board.update_project(0, name='proj1')
+        board.update_task(0, name='task1')
+        assert board.get_project_id_by_name('proj0') is None
+        assert board.get_project_id_by_name('proj1') == 0
+        assert board.get_task_id_by_name('task0') is None
+        assert board.get_task_id_by_name('task1') == 0
+        board.delete_project(0)
+        board.delete_task(0)
+        assert board.get_project_id_by_name('proj1') is None
+        assert board.get_task_id_by_name('task1') is None
+        assert board.create_task(Task(name='task1')) == 0
+        assert board.get_task_id_by_name('task1') == 0
+        board.clear()
+        assert board.get_task_id_by_name('task1') is None
+
+    @pytest.mark.parametrize('matcher', [case_insensitive_match, fuzzy_match])
+    def test_folded_name_index(self, matcher):
+        """Tests that case-insensitive project lookups agree with matching against every project name."""
+        names = ['proj', 'Project', ' other ', 'OTHER', 'thing']
+        board = Board(name='myboard', projects={i: Project(name=name) for (i, name) in enumerate(names)})
+        board.update_project(4, name='Things')
+        board.delete_project(2)
+        board.create_project(Project(name='pro'))
+        def brute_force(name):
+            pairs = [(id_, name == p.name) for (id_, p) in board.projects.items() if matcher(name, p.name)]
+            return board._filter_id_matches(pairs)
+        for query in ['proj', 'PROJ', 'pro', 'Pr', 'project', 'other', 'oth', 'thing', 'THINGS', 'Things', 'nothing']:
+            ids = brute_force(query)
+            if len(ids) > 1:
+                with pytest.raises(AmbiguousProjectNameError):
+                    board.get_project_id_by_name(query, matcher)
+            else:
+                assert board.get_project_id_by_name(query, matcher) == (ids[0] if ids else None)
+
+    @pytest.mark.parametrize('case_sensitive', [True, False])
+    def test_duplicate_project_name_index(self, case_sensitive):
+        """Tests that duplicate project name checks agree with matching against every project name."""
+        config = deepcopy(get_config())._replace(case_sensitive=case_sensitive)
+        with config.as_config():
+            names = ['proj', 'Proj', ' proj ', 'other', 'thing']
+            board = Board(name='myboard', projects={i: Project(name=name) for (i, name) in enumerate(names)})
+            board.update_project(4, name='THING')
+            board.delete_project(3)
+            board.create_project(Project(name='Other'))
+            def brute_force(name, exclude_id):
+                names = (p.name for (id_, p) in board.projects.items() if (id_ != exclude_id))
+                return first_name_match(config.name_matcher, name, names)
+            for query in ['proj', 'PROJ', 'proj ', 'other', 'thing', 'Thing', 'nothing']:
+                for exclude_id in [None, 0, 1, 3]:
+                    assert board._find_duplicate_project_name(query, exclude_id) == brute_force(query, exclude_id)
+
+    @pytest.mark.parametrize('case_sensitive', [True, False])
+    def test_duplicate_task_name_index(self, case_sensitive):
+        """Tests that duplicate task name checks agree with matching against every incomplete task name."""
+        config = deepcopy(get_config())._replace(case_sensitive=case_sensitive)
+        with config.as_config():
+            names = ['task', 'Task', ' task ', 'other', 'thing']
+            board = Board(name='myboard', tasks={i: Task(name=name) for (i, name) in enumerate(names)})
+            board.update_task(4, name='THING')
+            board.delete_task(3)
+            board.tasks[0] = board.tasks[0].started().completed()
+            board.create_task(Task(name='Other'))
+            def brute_force(name, exclude_id):
+                names = (t.name for (id_, t) in board.tasks.items() if (id_ != exclude_id) and (t.completed_time is None))
+                return first_name_match(config.name_matcher, name, names)
+            for query in ['task', 'TASK', 'task ', 'other', 'thing', 'Thing', 'nothing']:
+                for exclude_id in [None, 1, 2, 3]:
+                    assert board._find_duplicate_task_name(query, exclude_id) == brute_force(query, exclude_id)
+
     @pytest.mark.parametrize('case_sensitive', [True, False])
     def test_name_duplication(self, capsys, case_sensitive):
         """Tests what happens when we create projects or tasks with duplicate names."""
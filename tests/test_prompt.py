@@ -1,6 +1,10 @@
+import re
+
 import pytest
 
-from daikanban.prompt import simple_input, validated_input
+from daikanban.errors import UserInputError
+from daikanban.model import Task
+from daikanban.prompt import NONBLANK_INPUT, FieldPrompter, _prompt_text, simple_input, validated_input
 
 from . import patch_stdin
 
@@ -10,6 +14,8 @@ from . import patch_stdin
     ('A', None, 'A', 1, 'A'),
     ('B\nA', None, 'A', 2, 'A'),
     ('\n', 'A', '.*', 1, 'A'),
+    ('B\nA', None, re.compile('A'), 2, 'A'),
+    (' \nA', None, NONBLANK_INPUT, 2, 'A'),
 ])
 def test_simple_input(capsys, monkeypatch, user_input, default, match, iters, value):
     patch_stdin(monkeypatch, user_input)
@@ -30,3 +36,17 @@ def test_simple_input(capsys, monkeypatch, user_input, default, match, iters, va
 def test_validated_input_ok(capsys, monkeypatch, user_input, validator, default, value):
     patch_stdin(monkeypatch, user_input)
     assert validated_input('Q', validator, default=default) == value
+
+def test_field_prompter_validate():
+    prompter: FieldPrompter[Task, float] = FieldPrompter(Task, 'priority')
+    prompter.validate(3)
+    prompter.validate(None)
+    with pytest.raises(UserInputError, match='valid number'):
+        prompter.validate('abc')
+    with pytest.raises(UserInputError, match='greater than or equal to 0'):
+        FieldPrompter(Task, 'expected_difficulty').validate(-1)
+
+def test_prompt_text():
+    text = _prompt_text('Name [not bold]\\[optional][/]')
+    assert text.plain == 'Name [optional]'
+    assert _prompt_text('Name [not bold]\\[optional][/]') is text
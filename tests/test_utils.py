@@ -1,6 +1,6 @@
 import pytest
 
-from daikanban.utils import convert_number_words_to_digits, human_readable_duration, parse_key_value_pair
+from daikanban.utils import convert_number_words_to_digits, duration_in_words, err_style, frozen_current_time, get_current_time, human_readable_duration, join_in_blocks, make_prefix_map, parse_key_value_pair, style_str, to_snake_case
 
 
 @pytest.mark.parametrize(['string', 'expected'], [
@@ -16,6 +16,33 @@ from daikanban.utils import convert_number_words_to_digits, human_readable_durat
 def test_parse_equals_expression(string, expected):
     assert parse_key_value_pair(string, strict=False) == expected
 
+@pytest.mark.parametrize(['string', 'output'], [
+    ('abc', 'abc'),
+    ('My Board', 'my_board'),
+    ("  Bob's  board!", 'bobs_board_'),
+    ('a-b.c', 'a_b_c'),
+])
+def test_to_snake_case(string, output):
+    assert to_snake_case(string) == output
+
+@pytest.mark.parametrize(['chunks', 'block_size', 'blocks'], [
+    ([], 4, []),
+    (['a', 'b', 'c'], 1, ['a', 'b', 'c']),
+    (['a', 'b', 'c'], 2, ['ab', 'c']),
+    (['a', 'bcd', 'e', 'f'], 2, ['abcd', 'ef']),
+    (['a', 'b', 'c'], 10, ['abc']),
+])
+def test_join_in_blocks(chunks, block_size, blocks):
+    assert list(join_in_blocks(iter(chunks), block_size)) == blocks
+
+def test_make_prefix_map():
+    prefix_map = make_prefix_map(['show', ('schema', 2), ('set', 3)])
+    assert prefix_map == {'s': 'show', 'sh': 'show', 'sho': 'show', 'show': 'show', 'sc': 'schema', 'sch': 'schema', 'sche': 'schema', 'schem': 'schema', 'schema': 'schema', 'set': 'set'}
+    assert make_prefix_map([]) == {}
+    # full words are interned
+    word = 'board'
+    assert make_prefix_map([''.join(['bo', 'ard'])])['b'] is word
+
 @pytest.mark.parametrize(['string', 'output'], [
     ('abc', 'abc'),
     ('1 day', '1 day'),
@@ -45,3 +72,36 @@ def test_human_readable_duration(days, prefer_days, output):
     flags = [False, True] if (prefer_days is None) else [prefer_days]
     for flag in flags:
         assert human_readable_duration(days, prefer_days=flag) == output
+
+@pytest.mark.parametrize(['days', 'output'], [
+    (0, '0 microseconds'),
+    (1e-7, '0.01 seconds'),
+    (1 / (24 * 3600), '1 second'),
+    (0.5, '12 hours'),
+    (1.5, '1 day 12 hours'),
+    (0.999999, '23 hours 59 minutes 59 seconds'),
+    (10, '1 week 3 days'),
+    (365, '52 weeks 1 day'),
+])
+def test_duration_in_words(days, output):
+    assert duration_in_words(days) == output
+
+@pytest.mark.parametrize('days', [-1e-7, -1 / (24 * 3600), -0.5, -0.999999, -1, -1.5, -7, -10.5, -365, 0.25, 10.5])
+def test_duration_in_words_matches_pendulum(days):
+    import pendulum
+    assert duration_in_words(days) == pendulum.duration(days=days).in_words()
+
+def test_frozen_current_time():
+    with frozen_current_time() as now:
+        assert get_current_time() is now
+        with frozen_current_time() as inner_now:
+            assert inner_now is now
+        assert get_current_time() is now
+    assert get_current_time() is not now
+    assert get_current_time().tzinfo is not None
+
+def test_style_str():
+    assert style_str('abc', 'red') == '[not bold not italic red]abc[/]'
+    assert style_str(3, 'green', bold=True, italic=True) == '[bold italic green]3[/]'
+    assert err_style(ValueError('bad value')) == '[not bold not italic red]Bad value[/]'
+    assert err_style('') == '[not bold not italic red][/]'